@@ -1,77 +1,230 @@
+import reprlib
+import sys
+from typing import Callable, Optional
+
 from textnode import TextType
 
 
 class HTMLNode:
-    def __init__(self, tag=None, value=None, children=None, props=None):
+    """
+    Base node for the in-memory HTML tree.
+
+    Nodes are treated as immutable after construction: ``props`` must not be
+    mutated once passed in, since its serialized form is computed exactly
+    once and reused for every render.
+    """
+
+    # Slots halve per-node memory (no __dict__) and make attribute access a
+    # direct offset load; large documents allocate thousands of nodes
+    __slots__ = ("tag", "value", "children", "props", "_props_html", "_frozen", "_cached_html")
+
+    def __init__(
+        self,
+        tag: Optional[str] = None,
+        value: Optional[str] = None,
+        children: Optional[list] = None,
+        props: Optional[dict] = None,
+    ) -> None:
         self.tag = tag
         self.value = value
         self.children = children
         self.props = props
+        self._frozen = False
+        self._cached_html = None
+        # Props never change after construction in normal use, so serialize
+        # the attribute string once instead of on every render
+        if props is None:
+            self._props_html = ""
+        else:
+            # List-arg join beats the generator form: join can presize when
+            # given a sequence
+            self._props_html = "".join([f' {key}="{value}"' for key, value in props.items()])
 
-    def to_html(self):
+    def to_html(self) -> str:
         raise NotImplementedError
 
-    def props_to_html(self):
-        if self.props is None:
-            return ""
-        
-        html_attrs = ""
-        for key, value in self.props.items():
-            html_attrs += f' {key}="{value}"'
-        
-        return html_attrs
+    def freeze(self) -> "HTMLNode":
+        """
+        Opt this subtree in to render caching.
+
+        After freeze(), the first to_html() result of each node is memoized
+        and returned on later renders — useful for fragments shared across
+        pages (nav, footer). Mutating props or children after freezing is
+        undefined.
+
+        Returns:
+            This node, for chaining
+        """
+        self._frozen = True
+        if self.children:
+            for child in self.children:
+                child.freeze()
+        return self
+
+    def props_to_html(self) -> str:
+        return self._props_html
+
+    @reprlib.recursive_repr(fillvalue='...')
+    def __repr__(self) -> str:
+        # Summarize wide child lists: interpolating them verbatim would
+        # recursively repr the whole subtree every time a node is logged
+        children = self.children
+        if children is not None and len(children) > 4:
+            children = f"[<{len(children)} children>]"
+        return f"HTMLNode(tag={self.tag}, value={self.value}, children={children}, props={self.props})"
+
+
+def _make_emit(tag: str) -> Callable[[str], str]:
+    """
+    Build an emit function specialized for one tag, with the open and close
+    strings precomputed in its closure.
+    """
+    open_tag = f"<{tag}>"
+    close_tag = f"</{tag}>"
+    return lambda value: f"{open_tag}{value}{close_tag}"
 
-    def __repr__(self):
-        return f"HTMLNode(tag={self.tag}, value={self.value}, children={self.children}, props={self.props})"
+
+# HTML special characters escaped in one C-level translate pass instead of
+# chained str.replace scans. Only the characters significant in element
+# content are mapped — quotes are safe outside attributes, and escaping them
+# would mangle code blocks. The node's value attribute stays raw; only
+# serialized output is escaped.
+_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+})
+
+# Per-tag emitters for the common no-props case: the tag set a markdown
+# document can produce is small and known at import time
+_EMIT = {
+    tag: _make_emit(tag)
+    for tag in (
+        "b", "i", "code", "a", "p", "div", "span", "pre", "section",
+        "blockquote", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6",
+    )
+}
 
 
 class LeafNode(HTMLNode):
-    def __init__(self, tag, value, props=None):
+    __slots__ = ()
+
+    def __init__(self, tag: Optional[str], value: Optional[str], props: Optional[dict] = None) -> None:
         super().__init__(tag=tag, value=value, children=None, props=props)
-    
-    def to_html(self):
+
+    def to_html(self) -> str:
+        cached = self._cached_html
+        if cached is not None:
+            return cached
+
         if self.value is None:
             raise ValueError("All leaf nodes must have a value")
-        
+
+        value = self.value.translate(_ESCAPE)
         if self.tag is None:
-            return self.value
-        
-        props_html = self.props_to_html()
-        return f"<{self.tag}{props_html}>{self.value}</{self.tag}>"
+            html = value
+        elif self.props is None and self.tag in _EMIT:
+            html = _EMIT[self.tag](value)
+        else:
+            # Single f-string build; read the precomputed props slot directly
+            # to skip a method call on the hottest render path
+            html = f"<{self.tag}{self._props_html}>{value}</{self.tag}>"
+
+        if self._frozen:
+            self._cached_html = html
+        return html
 
 
 class ParentNode(HTMLNode):
-    def __init__(self, tag, children, props=None):
+    __slots__ = ()
+
+    def __init__(self, tag: Optional[str], children: Optional[list], props: Optional[dict] = None) -> None:
         super().__init__(tag=tag, value=None, children=children, props=props)
     
-    def to_html(self):
-        if self.tag is None:
+    def to_html(self) -> str:
+        cached = self._cached_html
+        if cached is not None:
+            return cached
+
+        html = "".join(render(self))
+        if self._frozen:
+            self._cached_html = html
+        return html
+
+
+def render(root: HTMLNode) -> list:
+    """
+    Iteratively walk a node tree, collecting HTML fragments in document order.
+
+    An explicit stack replaces recursion so deeply nested trees (blockquotes,
+    nested lists) neither pay a Python call frame per node nor risk hitting
+    the recursion limit. Fragments come back as one list so the caller's
+    join runs over a presized sequence instead of resuming a generator per
+    fragment.
+    """
+    _OPEN, _CLOSE = 0, 1
+    stack = [(root, _OPEN)]
+    out = []
+
+    while stack:
+        node, state = stack.pop()
+
+        if state == _CLOSE:
+            out.append(f"</{node.tag}>")
+            continue
+
+        if node._cached_html is not None:
+            out.append(node._cached_html)
+            continue
+
+        if not isinstance(node, ParentNode):
+            # Inline the common leaf emission; defer to to_html only for the
+            # edge cases so its validation errors are preserved
+            if isinstance(node, LeafNode) and node.value is not None:
+                value = node.value.translate(_ESCAPE)
+                if node.tag is None:
+                    out.append(value)
+                else:
+                    out.append(f"<{node.tag}{node._props_html}>{value}</{node.tag}>")
+            else:
+                out.append(node.to_html())
+            continue
+
+        if node.tag is None:
             raise ValueError("All parent nodes must have a tag")
-        
-        if self.children is None:
+
+        if node.children is None:
             raise ValueError("All parent nodes must have children")
-        
-        props_html = self.props_to_html()
-        
-        children_html = ""
-        for child in self.children:
-            children_html += child.to_html()
-        
-        return f"<{self.tag}{props_html}>{children_html}</{self.tag}>"
-
-
-def text_node_to_html_node(text_node):
-    if text_node.text_type == TextType.TEXT:
-        return LeafNode(None, text_node.text)
-    elif text_node.text_type == TextType.BOLD:
-        return LeafNode("b", text_node.text)
-    elif text_node.text_type == TextType.ITALIC:
-        return LeafNode("i", text_node.text)
-    elif text_node.text_type == TextType.CODE:
-        return LeafNode("code", text_node.text)
-    elif text_node.text_type == TextType.LINK:
-        return LeafNode("a", text_node.text, {"href": text_node.url})
-    elif text_node.text_type == TextType.IMAGE:
-        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-    else:
-        raise ValueError(f"Unsupported text type: {text_node.text_type}")
\ No newline at end of file
+
+        out.append(f"<{node.tag}{node._props_html}>")
+        stack.append((node, _CLOSE))
+        for child in reversed(node.children):
+            stack.append((child, _OPEN))
+
+    return out
+
+
+# Interned tag strings shared by every conversion
+_TAG_B = sys.intern("b")
+_TAG_I = sys.intern("i")
+_TAG_CODE = sys.intern("code")
+_TAG_A = sys.intern("a")
+_TAG_IMG = sys.intern("img")
+
+# Dispatch table keyed on TextType replaces the if/elif ladder with a single
+# dict lookup per conversion
+_TEXT_NODE_DISPATCH = {
+    TextType.TEXT: lambda node: LeafNode(None, node.text),
+    TextType.BOLD: lambda node: LeafNode(_TAG_B, node.text),
+    TextType.ITALIC: lambda node: LeafNode(_TAG_I, node.text),
+    TextType.CODE: lambda node: LeafNode(_TAG_CODE, node.text),
+    TextType.LINK: lambda node: LeafNode(_TAG_A, node.text, {"href": node.url}),
+    TextType.IMAGE: lambda node: LeafNode(_TAG_IMG, "", {"src": node.url, "alt": node.text}),
+}
+
+
+def text_node_to_html_node(text_node) -> LeafNode:
+    try:
+        return _TEXT_NODE_DISPATCH[text_node.text_type](text_node)
+    except KeyError:
+        raise ValueError(f"Unsupported text type: {text_node.text_type}") from None
\ No newline at end of file
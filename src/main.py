@@ -1,9 +1,14 @@
+import functools
+import hashlib
+import os
+import re
 import shutil
 import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
-from textnode import TextNode, TextType, markdown_to_html_node, extract_title
+from textnode import TextNode, TextType, markdown_to_html_str, extract_title
 
 # Configure logging
 logging.basicConfig(
@@ -50,15 +55,21 @@ def validate_path(path: str, must_exist: bool = True) -> Path:
     return path_obj
 
 
-def copy_static_to_public(src_dir: str, dest_dir: str) -> None:
+def copy_static_to_public(src_dir: str, dest_dir: str, clean: bool = True) -> None:
     """
     Recursively copy all contents from source directory to destination directory.
-    First deletes all contents of the destination directory to ensure a clean copy.
-    
+
+    By default deletes the destination first so the copy (and the build
+    around it) starts from a clean tree. With clean=False the static files
+    overlay the existing tree instead, preserving generated pages and their
+    mtimes for incremental rebuilds — at the cost of leaving behind outputs
+    whose sources were deleted.
+
     Args:
         src_dir: Source directory path
         dest_dir: Destination directory path
-        
+        clean: Delete the destination tree before copying
+
     Raises:
         ValueError: If paths are invalid
         OSError: If file operations fail
@@ -66,53 +77,52 @@ def copy_static_to_public(src_dir: str, dest_dir: str) -> None:
     try:
         src_path = validate_path(src_dir, must_exist=True)
         dest_path = validate_path(dest_dir, must_exist=False)
-        
-        # Delete destination directory if it exists
-        if dest_path.exists():
+
+        if clean and dest_path.exists():
             logger.info(f"Deleting existing directory: {dest_path}")
             shutil.rmtree(dest_path)
-        
-        # Create destination directory
-        logger.info(f"Creating directory: {dest_path}")
-        dest_path.mkdir(parents=True, exist_ok=True)
-        
-        # Copy all contents recursively
-        _copy_directory_contents(src_path, dest_path)
-        
+
+        # copytree walks with scandir internally in one tight loop; one log
+        # line for the whole tree instead of one per file
+        logger.info(f"Copying static tree: {src_path} -> {dest_path}")
+        shutil.copytree(src_path, dest_path, copy_function=_fast_copy, dirs_exist_ok=True)
+
     except Exception as e:
         logger.error(f"Error copying static files: {e}")
         raise
 
 
-def _copy_directory_contents(src_dir: Path, dest_dir: Path) -> None:
+def _fast_copy(src: Path, dst: Path) -> None:
     """
-    Helper function to recursively copy directory contents.
-    
+    Copy file contents without the metadata syscalls of shutil.copy2.
+
+    Uses os.copy_file_range where available (Linux: in-kernel, CoW-capable
+    copy), falling back to a buffered userspace copy with a 1 MiB buffer.
+
     Args:
-        src_dir: Source directory Path object
-        dest_dir: Destination directory Path object
+        src: Source file path
+        dst: Destination file path
     """
-    if not src_dir.exists():
-        logger.warning(f"Source directory does not exist: {src_dir}")
-        return
-    
-    try:
-        for item in src_dir.iterdir():
-            dest_path = dest_dir / item.name
-            
-            if item.is_dir():
-                # Create directory and recursively copy its contents
-                logger.info(f"Creating directory: {dest_path}")
-                dest_path.mkdir(parents=True, exist_ok=True)
-                _copy_directory_contents(item, dest_path)
-            else:
-                # Copy file with validation
-                logger.info(f"Copying file: {item} -> {dest_path}")
-                shutil.copy2(item, dest_path)
-                
-    except Exception as e:
-        logger.error(f"Error copying directory contents: {e}")
-        raise
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            if hasattr(os, 'copy_file_range'):
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+                if copied >= size:
+                    return
+        except OSError:
+            # copy_file_range can fail across filesystems on older kernels;
+            # restart with the portable buffered copy
+            pass
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, length=1 << 20)
 
 
 def sanitize_basepath(basepath: str) -> str:
@@ -137,116 +147,324 @@ def sanitize_basepath(basepath: str) -> str:
     if not basepath.endswith('/') and basepath != '/':
         basepath = basepath + '/'
     
-    # Remove any dangerous characters
-    basepath = basepath.replace('..', '').replace('//', '/')
-    
+    # Strip parent-dir segments and collapse repeated slashes in one scan
+    basepath = _BASEPATH_CLEAN_RE.sub('/', basepath)
+
     return basepath
 
 
-# Template cache for performance
-_template_cache: Optional[str] = None
+# Compiled once at import: template placeholders and root-relative href/src
+# attributes
+_PLACEHOLDER_RE = re.compile(r'\{\{ (Title|Content) \}\}')
+_ROOT_LINK_RE = re.compile(r'(href|src)="/')
+
+# Dangerous basepath fragments removed in a single substitution pass: any
+# run of '..'/slash tokens (e.g. '/../', '//') collapses to one slash
+_BASEPATH_CLEAN_RE = re.compile(r'(?:/|\.\.){2,}|\.\.')
+
+# HTML-escape table for titles: one C-level translate pass, and unlike the
+# old replace chain it also covers '&' and '"'
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+})
+
+
+# Rendered-HTML cache keyed by content hash so unchanged pages skip the
+# markdown parse entirely on incremental rebuilds
+_CACHE_DIR = Path(__file__).parent.parent / '.sitegen_cache'
+_render_cache: dict = {}
+
+
+def _generator_digest() -> str:
+    """
+    Digest of the generator's own source modules.
+
+    Folded into every persistent cache key (and the build stamp): entries
+    are never invalidated individually, so any code change that can alter
+    rendered output must change the key. Hashing the sources does that
+    without a manually-bumped version constant.
+
+    Returns:
+        Hex digest string identifying this generator version
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for name in ('textnode.py', 'htmlnode.py', 'main.py'):
+        h.update(Path(__file__).with_name(name).read_bytes())
+    return h.hexdigest()
+
+
+_GENERATOR_DIGEST = _generator_digest()
+
+
+def render_markdown(markdown_content: str) -> str:
+    """
+    Convert markdown to HTML with content-hash caching.
+
+    Results are cached in memory and persisted to a .sitegen_cache directory
+    so repeated builds skip parsing for unchanged pages.
+
+    Args:
+        markdown_content: Markdown source text
+
+    Returns:
+        Rendered HTML string
+    """
+    # Key = generator version + content: a cache populated by an older
+    # generator whose output differs can never be served by this one
+    hasher = hashlib.blake2b(_GENERATOR_DIGEST.encode('ascii'), digest_size=16)
+    hasher.update(markdown_content.encode('utf-8'))
+    key = hasher.hexdigest()
+
+    cached = _render_cache.get(key)
+    if cached is not None:
+        return cached
+
+    cache_file = _CACHE_DIR / f'{key}.html'
+    if cache_file.exists():
+        html_content = cache_file.read_text(encoding='utf-8')
+    else:
+        html_content = markdown_to_html_str(markdown_content)
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so readers never see a partial entry: the
+            # key is the content hash and is never invalidated, so a
+            # truncated file (interrupted build, two pool workers racing on
+            # identical content) would poison every later build. os.replace
+            # is atomic on the same filesystem; the pid suffix keeps
+            # concurrent writers off each other's temp file.
+            tmp_file = _CACHE_DIR / f'{key}.{os.getpid()}.tmp'
+            tmp_file.write_text(html_content, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            # Cache persistence is best-effort; the build must not fail on it
+            logger.warning(f"Could not write render cache: {e}")
+
+    _render_cache[key] = html_content
+    return html_content
+
+
+@functools.lru_cache(maxsize=8)
+def _read_template(path_str: str) -> str:
+    """
+    Read and cache template content, keyed by resolved path.
+
+    A path-keyed LRU (rather than a single module global) stays correct when
+    different templates are used in the same process, e.g. in tests.
+
+    Args:
+        path_str: Resolved path to the template file
+
+    Returns:
+        Template content as string
+    """
+    return Path(path_str).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=8)
+def _template_segments(template_content: str, clean_basepath: str) -> tuple:
+    """
+    Split a template into literal and placeholder segments.
+
+    Root-relative links in the literal text are rewritten to the basepath and
+    the literals are pre-encoded to UTF-8 up front; the result is cached per
+    (template, basepath), so per-page work reduces to encoding the title and
+    content.
+
+    Args:
+        template_content: Raw template text
+        clean_basepath: Sanitized base path for the site
+
+    Returns:
+        Tuple where even indices are encoded literal fragments (bytes) and
+        odd indices are placeholder names ('Title' or 'Content')
+    """
+    rewritten = _ROOT_LINK_RE.sub(
+        lambda m: f'{m.group(1)}="{clean_basepath}', template_content
+    )
+    return tuple(
+        part if i % 2 else part.encode('utf-8')
+        for i, part in enumerate(_PLACEHOLDER_RE.split(rewritten))
+    )
+
+
+def _writev_all(fd: int, buffers: list) -> None:
+    """
+    Write a list of bytes buffers to a file descriptor, handling short writes.
+
+    Args:
+        fd: Open file descriptor
+        buffers: List of bytes objects to write in order
+    """
+    while buffers:
+        written = os.writev(fd, buffers)
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers[0])
+            buffers.pop(0)
+        if buffers and written:
+            buffers[0] = buffers[0][written:]
 
 
 def get_template_content(template_path: str) -> str:
     """
     Get template content with caching for performance.
-    
+
     Args:
         template_path: Path to the HTML template file
-        
+
     Returns:
         Template content as string
     """
-    global _template_cache
-    
-    if _template_cache is None:
-        template_path_obj = validate_path(template_path, must_exist=True)
-        try:
-            with open(template_path_obj, 'r', encoding='utf-8') as f:
-                _template_cache = f.read()
-        except UnicodeDecodeError:
-            logger.error(f"Invalid UTF-8 encoding in template: {template_path_obj}")
-            raise
-    
-    return _template_cache
+    template_path_obj = validate_path(template_path, must_exist=True)
+    try:
+        return _read_template(str(template_path_obj))
+    except UnicodeDecodeError:
+        logger.error(f"Invalid UTF-8 encoding in template: {template_path_obj}")
+        raise
+
+
+def _generate_page(from_path_obj: Path, template_content: str, dest_path_obj: Path, clean_basepath: str) -> None:
+    """
+    Render a single markdown file to an HTML page.
+
+    Assumes paths are already validated and the basepath sanitized, so the
+    per-page hot loop pays no redundant resolve()/stat() calls.
+
+    Args:
+        from_path_obj: Validated path to the markdown source
+        template_content: Pre-fetched HTML template content
+        dest_path_obj: Validated destination path for the generated HTML
+        clean_basepath: Sanitized base path for the site
+    """
+    # Per-page logging is DEBUG-only: at thousands of pages the f-string
+    # formatting and handler flushes otherwise dominate the real work
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Generating page from {from_path_obj} to {dest_path_obj}")
+
+    # Read markdown file with error handling
+    try:
+        with open(from_path_obj, 'r', encoding='utf-8') as f:
+            markdown_content = f.read()
+    except UnicodeDecodeError:
+        logger.error(f"Invalid UTF-8 encoding in file: {from_path_obj}")
+        raise
+
+    # Convert markdown to HTML (cached by content hash)
+    html_content = render_markdown(markdown_content)
+
+    # Extract the title
+    title = extract_title(markdown_content)
+
+    # Sanitize title to prevent XSS
+    title = title.translate(_HTML_ESCAPE_TABLE)
+
+    # Rewrite root-relative links in the rendered content; the template's own
+    # links and placeholder split are cached per (template, basepath)
+    def rewrite_link(match):
+        return f'{match.group(1)}="{clean_basepath}'
+
+    values = {
+        'Title': title,
+        'Content': _ROOT_LINK_RE.sub(rewrite_link, html_content),
+    }
+    segments = _template_segments(template_content, clean_basepath)
+
+    # Create destination directory if it doesn't exist
+    dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+    # Stream the interleaved segments straight to a raw fd; the fixed
+    # fragments are already bytes, only title and content need encoding
+    buffers = [
+        values[segment].encode('utf-8') if i % 2 else segment
+        for i, segment in enumerate(segments)
+    ]
+    fd = os.open(dest_path_obj, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _writev_all(fd, buffers)
+    finally:
+        os.close(fd)
 
 
 def generate_page(from_path: str, template_path: str, dest_path: str, basepath: str) -> None:
     """
     Generate an HTML page from a markdown file using a template.
-    
+
     Args:
         from_path: Path to the markdown file to convert
         template_path: Path to the HTML template file
         dest_path: Path where the generated HTML will be written
         basepath: Base path for the site (e.g., "/" or "/pySiteGen/")
-        
+
     Raises:
         ValueError: If paths are invalid
         FileNotFoundError: If input files don't exist
         OSError: If file operations fail
     """
     try:
-        # Validate paths
         from_path_obj = validate_path(from_path, must_exist=True)
         dest_path_obj = validate_path(dest_path, must_exist=False)
-        
-        # Sanitize basepath
         clean_basepath = sanitize_basepath(basepath)
-        
-        logger.info(f"Generating page from {from_path_obj} to {dest_path_obj}")
-        
-        # Read markdown file with error handling
-        try:
-            with open(from_path_obj, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-        except UnicodeDecodeError:
-            logger.error(f"Invalid UTF-8 encoding in file: {from_path_obj}")
-            raise
-        
-        # Get cached template content
         template_content = get_template_content(template_path)
-        
-        # Convert markdown to HTML
-        html_node = markdown_to_html_node(markdown_content)
-        html_content = html_node.to_html()
-        
-        # Extract the title
-        title = extract_title(markdown_content)
-        
-        # Sanitize title to prevent XSS
-        title = title.replace('<', '&lt;').replace('>', '&gt;')
-        
-        # Replace placeholders in template
-        final_html = template_content.replace('{{ Title }}', title)
-        final_html = final_html.replace('{{ Content }}', html_content)
-        
-        # Replace href and src paths with basepath
-        final_html = final_html.replace('href="/', f'href="{clean_basepath}')
-        final_html = final_html.replace('src="/', f'src="{clean_basepath}')
-        
-        # Create destination directory if it doesn't exist
-        dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write the final HTML to the destination
-        with open(dest_path_obj, 'w', encoding='utf-8') as f:
-            f.write(final_html)
-            
+        _generate_page(from_path_obj, template_content, dest_path_obj, clean_basepath)
     except Exception as e:
         logger.error(f"Error generating page: {e}")
         raise
 
 
-def generate_pages_recursive(dir_path_content: str, template_path: str, dest_dir_path: str, basepath: str) -> None:
+# Per-worker render context, seeded once by _init_worker so job tuples stay
+# small and the template isn't re-read or re-pickled per page
+_worker_template: Optional[str] = None
+_worker_basepath: str = "/"
+
+
+def _init_worker(template_content: str, clean_basepath: str) -> None:
     """
-    Recursively generate HTML pages from all markdown files in a content directory.
-    
+    Seed a worker process's render context so workers don't re-read the template.
+
+    Args:
+        template_content: Pre-read template content from the parent process
+        clean_basepath: Sanitized base path for the site
+    """
+    global _worker_template, _worker_basepath
+    _worker_template = template_content
+    _worker_basepath = clean_basepath
+
+
+def _generate_page_job(job: tuple) -> None:
+    """
+    Render one (from_path, dest_path) job using the seeded worker context.
+
+    Args:
+        job: Tuple of (source Path, destination Path)
+    """
+    from_path_obj, dest_path_obj = job
+    _generate_page(from_path_obj, _worker_template, dest_path_obj, _worker_basepath)
+
+
+def generate_pages_recursive(dir_path_content: str, template_path: str, dest_dir_path: str, basepath: str, incremental: bool = False) -> None:
+    """
+    Generate HTML pages from all markdown files in a content directory.
+
+    Walks the content tree once to collect (source, destination) jobs, then
+    renders them in parallel across CPU cores — each page is independent and
+    markdown parsing is CPU-bound.
+
+    With incremental=True, pages whose output is newer than both their
+    source and the template are skipped — but only when the .buildstamp in
+    the destination records the same basepath and generator version as this
+    run, since mtimes alone cannot see either changing (nor survive a git
+    checkout, which flattens them). On any mismatch every page is rebuilt
+    and a fresh stamp is written.
+
     Args:
         dir_path_content: Path to the content directory containing markdown files
         template_path: Path to the HTML template file
         dest_dir_path: Path to the destination directory for generated HTML files
         basepath: Base path for the site (e.g., "/" or "/pySiteGen/")
-        
+        incremental: Skip up-to-date pages instead of rebuilding everything
+
     Raises:
         ValueError: If paths are invalid
         OSError: If file operations fail
@@ -255,25 +473,74 @@ def generate_pages_recursive(dir_path_content: str, template_path: str, dest_dir
         content_path = validate_path(dir_path_content, must_exist=True)
         template_path_obj = validate_path(template_path, must_exist=True)
         dest_path = validate_path(dest_dir_path, must_exist=False)
-        
-        # Ensure destination directory exists
+
+        # Validate once up front; per-page work then skips resolve()/stat()
+        clean_basepath = sanitize_basepath(basepath)
+        template_content = get_template_content(str(template_path_obj))
+        template_mtime = os.stat(template_path_obj).st_mtime
+
         dest_path.mkdir(parents=True, exist_ok=True)
-        
-        for item in content_path.iterdir():
-            item_dest_path = dest_path / item.name
-            
-            if item.is_dir():
-                # Create corresponding directory in destination
-                item_dest_path.mkdir(parents=True, exist_ok=True)
-                # Recursively process subdirectory
-                generate_pages_recursive(str(item), str(template_path_obj), str(item_dest_path), basepath)
-            elif item.suffix == '.md':
-                # Convert .md extension to .html
-                html_filename = item.stem + '.html'
-                html_dest_path = dest_path / html_filename
-                # Generate the HTML page
-                generate_page(str(item), str(template_path_obj), str(html_dest_path), basepath)
-                
+
+        # mtime skipping is only sound when the existing outputs were built
+        # by this generator version for this basepath; the stamp carries both
+        stamp_path = dest_path / '.buildstamp'
+        stamp = f"{_GENERATOR_DIGEST} {clean_basepath}\n"
+        allow_skip = incremental
+        if incremental:
+            try:
+                allow_skip = stamp_path.read_text(encoding='utf-8') == stamp
+            except OSError:
+                allow_skip = False
+            if not allow_skip:
+                logger.info("Build stamp missing or stale; rebuilding all pages")
+
+        # One flat scandir-backed rglob replaces the Python-level recursion;
+        # destinations fall out of relative-path arithmetic
+        jobs = []
+        skipped = 0
+        dest_parents = set()
+        for src in content_path.rglob('*.md'):
+            dst = dest_path / src.relative_to(content_path).with_suffix('.html')
+
+            # Make-style incremental build: skip pages whose output is newer
+            # than both the source and the template
+            if allow_skip:
+                try:
+                    dst_mtime = os.stat(dst).st_mtime
+                except FileNotFoundError:
+                    dst_mtime = -1.0
+                if os.stat(src).st_mtime <= dst_mtime and template_mtime <= dst_mtime:
+                    skipped += 1
+                    continue
+
+            dest_parents.add(dst.parent)
+            jobs.append((src, dst))
+
+        # Create each distinct destination directory at most once
+        for parent in dest_parents:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        if skipped:
+            logger.info(f"Skipped {skipped} up-to-date page(s)")
+
+        if len(jobs) <= 1:
+            # Not worth spinning up a process pool for a single page
+            for src, dst in jobs:
+                _generate_page(src, template_content, dst, clean_basepath)
+        else:
+            # Seed each worker with the template and basepath once
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_worker,
+                initargs=(template_content, clean_basepath),
+            ) as executor:
+                # Consume the iterator so worker exceptions propagate
+                list(executor.map(_generate_page_job, jobs, chunksize=8))
+
+        # Record what these outputs were built with, for the next
+        # incremental run's skip decision
+        stamp_path.write_text(stamp, encoding='utf-8')
+
     except Exception as e:
         logger.error(f"Error generating pages recursively: {e}")
         raise
@@ -287,9 +554,16 @@ def main() -> None:
         SystemExit: If critical errors occur
     """
     try:
-        # Get basepath from command line argument, default to "/"
-        basepath = sys.argv[1] if len(sys.argv) > 1 else "/"
-        
+        # Arguments: an optional --incremental flag plus an optional
+        # basepath (default "/"). A full clean build is the default; the
+        # flag opts in to the mtime-based skip, which only fires when the
+        # destination's .buildstamp matches this basepath and generator.
+        args = sys.argv[1:]
+        incremental = '--incremental' in args
+        if incremental:
+            args.remove('--incremental')
+        basepath = args[0] if args else "/"
+
         # Validate basepath
         try:
             basepath = sanitize_basepath(basepath)
@@ -312,19 +586,16 @@ def main() -> None:
                 logger.error(f"Required {name} not found: {path}")
                 sys.exit(1)
         
-        # Delete anything in the public directory
-        if public_dir.exists():
-            logger.info(f"Deleting existing public directory: {public_dir}")
-            shutil.rmtree(public_dir)
-        
-        # Copy static files to public directory
+        # Copy static files to public directory. Clean builds wipe the tree
+        # first; incremental builds overlay it so existing outputs keep the
+        # mtimes the skip check depends on
         logger.info("Starting static file copy...")
-        copy_static_to_public(str(static_dir), str(public_dir))
+        copy_static_to_public(str(static_dir), str(public_dir), clean=not incremental)
         logger.info("Static file copy completed!")
-        
+
         # Generate all pages recursively
         logger.info("Generating all pages...")
-        generate_pages_recursive(str(content_dir), str(template_path), str(public_dir), basepath)
+        generate_pages_recursive(str(content_dir), str(template_path), str(public_dir), basepath, incremental=incremental)
         logger.info("Page generation completed!")
         
     except KeyboardInterrupt:
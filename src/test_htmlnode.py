@@ -2,6 +2,9 @@ import unittest
 from htmlnode import HTMLNode, LeafNode, ParentNode, text_node_to_html_node
 from textnode import TextNode, TextType
 
+# Shared read-only fixture: constructed once instead of per test method
+_CHILD_SPAN = LeafNode("span", "child")
+
 
 class TestHTMLNode(unittest.TestCase):
     def test_props_to_html_with_props(self):
@@ -59,6 +62,19 @@ class TestLeafNode(unittest.TestCase):
     def test_leaf_to_html_b_tag(self):
         node = LeafNode("b", "Bold text")
         self.assertEqual(node.to_html(), "<b>Bold text</b>")
+
+    def test_leaf_to_html_escapes_special_characters(self):
+        # Serialization escapes the element-content metacharacters; quotes
+        # are deliberately left raw (only significant inside attributes)
+        node = LeafNode("p", "Tom & Jerry <3 \"scare quotes\" & 'ticks'")
+        self.assertEqual(
+            node.to_html(),
+            "<p>Tom &amp; Jerry &lt;3 \"scare quotes\" &amp; 'ticks'</p>",
+        )
+
+    def test_leaf_to_html_escapes_without_tag(self):
+        node = LeafNode(None, "a < b > c & d")
+        self.assertEqual(node.to_html(), "a &lt; b &gt; c &amp; d")
     
     def test_leaf_to_html_i_tag(self):
         node = LeafNode("i", "Italic text")
@@ -67,8 +83,7 @@ class TestLeafNode(unittest.TestCase):
 
 class TestParentNode(unittest.TestCase):
     def test_to_html_with_children(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode("div", [child_node])
+        parent_node = ParentNode("div", [_CHILD_SPAN])
         self.assertEqual(parent_node.to_html(), "<div><span>child</span></div>")
 
     def test_to_html_with_grandchildren(self):
@@ -94,13 +109,11 @@ class TestParentNode(unittest.TestCase):
         self.assertEqual(node.to_html(), expected)
 
     def test_to_html_with_props(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode("div", [child_node], {"class": "container"})
+        parent_node = ParentNode("div", [_CHILD_SPAN], {"class": "container"})
         self.assertEqual(parent_node.to_html(), '<div class="container"><span>child</span></div>')
 
     def test_to_html_with_multiple_props(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode("div", [child_node], {"class": "container", "id": "main"})
+        parent_node = ParentNode("div", [_CHILD_SPAN], {"class": "container", "id": "main"})
         self.assertEqual(parent_node.to_html(), '<div class="container" id="main"><span>child</span></div>')
 
     def test_to_html_nested_parent_nodes(self):
@@ -126,8 +139,7 @@ class TestParentNode(unittest.TestCase):
         self.assertEqual(outer_parent.to_html(), expected)
 
     def test_to_html_no_tag_raises_error(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode(None, [child_node])
+        parent_node = ParentNode(None, [_CHILD_SPAN])
         with self.assertRaises(ValueError) as context:
             parent_node.to_html()
         self.assertIn("tag", str(context.exception))
@@ -148,17 +160,15 @@ class TestParentNode(unittest.TestCase):
         self.assertEqual(parent_node.to_html(), "<div><p>Single child</p></div>")
 
     def test_constructor_no_props(self):
-        child_node = LeafNode("span", "child")
-        parent_node = ParentNode("div", [child_node])
+        parent_node = ParentNode("div", [_CHILD_SPAN])
         self.assertIsNone(parent_node.props)
         self.assertEqual(parent_node.tag, "div")
-        self.assertEqual(parent_node.children, [child_node])
+        self.assertEqual(parent_node.children, [_CHILD_SPAN])
         self.assertIsNone(parent_node.value)
 
     def test_constructor_with_props(self):
-        child_node = LeafNode("span", "child")
         props = {"class": "test", "id": "main"}
-        parent_node = ParentNode("div", [child_node], props)
+        parent_node = ParentNode("div", [_CHILD_SPAN], props)
         self.assertEqual(parent_node.props, props)
 
 
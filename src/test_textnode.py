@@ -1,781 +1,845 @@
+import sys
 import unittest
 
-from textnode import TextNode, TextType, split_nodes_delimiter, extract_markdown_images, extract_markdown_links, split_nodes_image, split_nodes_link, text_to_textnodes, markdown_to_blocks, BlockType, block_to_block_type, text_to_children, markdown_to_html_node, extract_title
+from textnode import TextNode, TextType, TextBatch, split_nodes_delimiter, extract_markdown_images, extract_markdown_links, split_nodes_image, split_nodes_link, text_to_textnodes, markdown_to_blocks, BlockType, block_to_block_type, text_to_children, markdown_to_html_node, extract_title
 
 
-class TestTextNode(unittest.TestCase):
-    def test_eq(self):
-        node = TextNode("This is a text node", TextType.BOLD)
-        node2 = TextNode("This is a text node", TextType.BOLD)
-        self.assertEqual(node, node2)
-
-    def test_eq_with_url(self):
-        node = TextNode("This is a link", TextType.LINK, "https://example.com")
-        node2 = TextNode("This is a link", TextType.LINK, "https://example.com")
-        self.assertEqual(node, node2)
-    
-    def test_eq_with_none_url(self):
-        node = TextNode("This is text", TextType.TEXT, None)
-        node2 = TextNode("This is text", TextType.TEXT, None)
-        self.assertEqual(node, node2)
-    
-    def test_not_eq_different_text(self):
-        node = TextNode("This is a text node", TextType.BOLD)
-        node2 = TextNode("This is different text", TextType.BOLD)
-        self.assertNotEqual(node, node2)
-    
-    def test_not_eq_different_text_type(self):
-        node = TextNode("This is a text node", TextType.BOLD)
-        node2 = TextNode("This is a text node", TextType.ITALIC)
-        self.assertNotEqual(node, node2)
-    
-    def test_not_eq_different_url(self):
-        node = TextNode("This is a link", TextType.LINK, "https://example.com")
-        node2 = TextNode("This is a link", TextType.LINK, "https://different.com")
-        self.assertNotEqual(node, node2)
-    
-    def test_not_eq_url_vs_none(self):
-        node = TextNode("This is text", TextType.TEXT, "https://example.com")
-        node2 = TextNode("This is text", TextType.TEXT, None)
-        self.assertNotEqual(node, node2)
-
-
-class TestSplitNodesDelimiter(unittest.TestCase):
-    def test_split_code_delimiter(self):
-        node = TextNode("This is text with a `code block` word", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("This is text with a ", TextType.TEXT),
-            TextNode("code block", TextType.CODE),
-            TextNode(" word", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
-
-    def test_split_bold_delimiter(self):
-        node = TextNode("This is text with a **bold** word", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        expected = [
-            TextNode("This is text with a ", TextType.TEXT),
-            TextNode("bold", TextType.BOLD),
-            TextNode(" word", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
-
-    def test_split_italic_delimiter(self):
-        node = TextNode("This is text with an *italic* word", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "*", TextType.ITALIC)
-        expected = [
-            TextNode("This is text with an ", TextType.TEXT),
-            TextNode("italic", TextType.ITALIC),
-            TextNode(" word", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
-
-    def test_split_multiple_delimiters(self):
-        node = TextNode("This has `code` and **bold** text", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("This has ", TextType.TEXT),
-            TextNode("code", TextType.CODE),
-            TextNode(" and **bold** text", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
-
-    def test_split_multiple_same_delimiters(self):
-        node = TextNode("This has `first` and `second` code blocks", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("This has ", TextType.TEXT),
-            TextNode("first", TextType.CODE),
-            TextNode(" and ", TextType.TEXT),
-            TextNode("second", TextType.CODE),
-            TextNode(" code blocks", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
+# The most repeated URL literals, interned once: node equality on the url
+# field becomes a pointer compare instead of a byte compare
+_URL_EXAMPLE = sys.intern("https://example.com")
+_URL_EXAMPLE_IMG = sys.intern("https://example.com/img.png")
+_URL_EXAMPLE_IMAGE = sys.intern("https://example.com/image.png")
 
-    def test_split_no_delimiter(self):
-        node = TextNode("This is just plain text", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [node]
-        self.assertEqual(new_nodes, expected)
+# Enum members bound once at import: the data tables below reference these
+# thousands of times, and a local alias skips the repeated attribute lookup
+_TEXT = TextType.TEXT
+_BOLD = TextType.BOLD
+_ITALIC = TextType.ITALIC
+_CODE = TextType.CODE
+_IMAGE = TextType.IMAGE
+_LINK = TextType.LINK
 
-    def test_split_non_text_node(self):
-        node = TextNode("bold text", TextType.BOLD)
-        new_nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        expected = [node]
-        self.assertEqual(new_nodes, expected)
 
-    def test_split_mixed_node_types(self):
-        nodes = [
-            TextNode("This is text with `code`", TextType.TEXT),
-            TextNode("Already bold", TextType.BOLD),
-            TextNode("More text with `inline code`", TextType.TEXT),
-        ]
-        new_nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
-        expected = [
-            TextNode("This is text with ", TextType.TEXT),
-            TextNode("code", TextType.CODE),
-            TextNode("Already bold", TextType.BOLD),
-            TextNode("More text with ", TextType.TEXT),
-            TextNode("inline code", TextType.CODE),
-        ]
-        self.assertEqual(new_nodes, expected)
+class NodeAssertions:
+    """Mixin adding a batch comparator for node/tuple lists."""
 
-    def test_split_empty_delimiter_content(self):
-        node = TextNode("This has `` empty code", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("This has ", TextType.TEXT),
-            TextNode(" empty code", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
+    def assertNodes(self, got, expected):
+        # One C-level sequence compare on the passing path; only fall back
+        # to assertListEqual (and its rich diff) on mismatch
+        if got == expected:
+            return
+        self.assertListEqual(got, expected)
 
-    def test_split_delimiter_at_start(self):
-        node = TextNode("`code` at start", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("code", TextType.CODE),
-            TextNode(" at start", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
 
-    def test_split_delimiter_at_end(self):
-        node = TextNode("Text ends with `code`", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("Text ends with ", TextType.TEXT),
-            TextNode("code", TextType.CODE),
-        ]
-        self.assertEqual(new_nodes, expected)
+class TestTextNode(unittest.TestCase):
+    # (name, first node, second node, expected equality) rows consumed by
+    # one subTest loop
+    CASES = (
+        (
+            "eq",
+            TextNode("This is a text node", _BOLD),
+            TextNode("This is a text node", _BOLD),
+            True,
+        ),
+        (
+            "eq_with_url",
+            TextNode("This is a link", _LINK, _URL_EXAMPLE),
+            TextNode("This is a link", _LINK, _URL_EXAMPLE),
+            True,
+        ),
+        (
+            "eq_with_none_url",
+            TextNode("This is text", _TEXT, None),
+            TextNode("This is text", _TEXT, None),
+            True,
+        ),
+        (
+            "not_eq_different_text",
+            TextNode("This is a text node", _BOLD),
+            TextNode("This is different text", _BOLD),
+            False,
+        ),
+        (
+            "not_eq_different_text_type",
+            TextNode("This is a text node", _BOLD),
+            TextNode("This is a text node", _ITALIC),
+            False,
+        ),
+        (
+            "not_eq_different_url",
+            TextNode("This is a link", _LINK, _URL_EXAMPLE),
+            TextNode("This is a link", _LINK, "https://different.com"),
+            False,
+        ),
+        (
+            "not_eq_url_vs_none",
+            TextNode("This is text", _TEXT, _URL_EXAMPLE),
+            TextNode("This is text", _TEXT, None),
+            False,
+        ),
+    )
+
+    def test_equality_cases(self):
+        for name, node, node2, expected_eq in self.CASES:
+            with self.subTest(case=name):
+                if expected_eq:
+                    self.assertEqual(node, node2)
+                else:
+                    self.assertNotEqual(node, node2)
+
+
+class TestSplitNodesDelimiter(NodeAssertions, unittest.TestCase):
+    # One row per case: (name, input nodes, delimiter, text_type, expected).
+    # A single data-driven loop amortizes the per-method unittest overhead;
+    # subTest keeps per-case failure reporting.
+    CASES = (
+        (
+            "code_delimiter",
+            (TextNode("This is text with a `code block` word", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("This is text with a ", _TEXT),
+                TextNode("code block", _CODE),
+                TextNode(" word", _TEXT),
+            ],
+        ),
+        (
+            "bold_delimiter",
+            (TextNode("This is text with a **bold** word", _TEXT),),
+            "**", _BOLD,
+            [
+                TextNode("This is text with a ", _TEXT),
+                TextNode("bold", _BOLD),
+                TextNode(" word", _TEXT),
+            ],
+        ),
+        (
+            "italic_delimiter",
+            (TextNode("This is text with an *italic* word", _TEXT),),
+            "*", _ITALIC,
+            [
+                TextNode("This is text with an ", _TEXT),
+                TextNode("italic", _ITALIC),
+                TextNode(" word", _TEXT),
+            ],
+        ),
+        (
+            "multiple_delimiters",
+            (TextNode("This has `code` and **bold** text", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("This has ", _TEXT),
+                TextNode("code", _CODE),
+                TextNode(" and **bold** text", _TEXT),
+            ],
+        ),
+        (
+            "multiple_same_delimiters",
+            (TextNode("This has `first` and `second` code blocks", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("This has ", _TEXT),
+                TextNode("first", _CODE),
+                TextNode(" and ", _TEXT),
+                TextNode("second", _CODE),
+                TextNode(" code blocks", _TEXT),
+            ],
+        ),
+        (
+            "no_delimiter",
+            (TextNode("This is just plain text", _TEXT),),
+            "`", _CODE,
+            [TextNode("This is just plain text", _TEXT)],
+        ),
+        (
+            "non_text_node",
+            (TextNode("bold text", _BOLD),),
+            "**", _BOLD,
+            [TextNode("bold text", _BOLD)],
+        ),
+        (
+            "mixed_node_types",
+            (
+                TextNode("This is text with `code`", _TEXT),
+                TextNode("Already bold", _BOLD),
+                TextNode("More text with `inline code`", _TEXT),
+            ),
+            "`", _CODE,
+            [
+                TextNode("This is text with ", _TEXT),
+                TextNode("code", _CODE),
+                TextNode("Already bold", _BOLD),
+                TextNode("More text with ", _TEXT),
+                TextNode("inline code", _CODE),
+            ],
+        ),
+        (
+            "empty_delimiter_content",
+            (TextNode("This has `` empty code", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("This has ", _TEXT),
+                TextNode(" empty code", _TEXT),
+            ],
+        ),
+        (
+            "delimiter_at_start",
+            (TextNode("`code` at start", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("code", _CODE),
+                TextNode(" at start", _TEXT),
+            ],
+        ),
+        (
+            "delimiter_at_end",
+            (TextNode("Text ends with `code`", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("Text ends with ", _TEXT),
+                TextNode("code", _CODE),
+            ],
+        ),
+        (
+            "only_delimiter",
+            (TextNode("`code`", _TEXT),),
+            "`", _CODE,
+            [TextNode("code", _CODE)],
+        ),
+        (
+            "empty_text_node",
+            (TextNode("", _TEXT),),
+            "`", _CODE,
+            [],
+        ),
+        (
+            "whitespace_only_delimiter",
+            (TextNode("Text with ` ` space code", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode(" ", _CODE),
+                TextNode(" space code", _TEXT),
+            ],
+        ),
+        (
+            "consecutive_delimiters",
+            (TextNode("Text with `first``second` consecutive", _TEXT),),
+            "`", _CODE,
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("first", _CODE),
+                TextNode("second", _CODE),
+                TextNode(" consecutive", _TEXT),
+            ],
+        ),
+    )
 
-    def test_split_only_delimiter(self):
-        node = TextNode("`code`", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("code", TextType.CODE),
-        ]
-        self.assertEqual(new_nodes, expected)
+    def test_split_delimiter_cases(self):
+        for name, nodes, delimiter, text_type, expected in self.CASES:
+            with self.subTest(case=name):
+                self.assertNodes(split_nodes_delimiter(list(nodes), delimiter, text_type), expected)
 
     def test_split_unclosed_delimiter_raises_error(self):
-        node = TextNode("This has `unclosed delimiter", TextType.TEXT)
-        with self.assertRaises(ValueError) as context:
-            split_nodes_delimiter([node], "`", TextType.CODE)
-        self.assertIn("unclosed delimiter", str(context.exception))
+        node = TextNode("This has `unclosed delimiter", _TEXT)
+        with self.assertRaisesRegex(ValueError, "unclosed delimiter"):
+            split_nodes_delimiter([node], "`", _CODE)
 
     def test_split_multiple_unclosed_delimiters(self):
-        node = TextNode("This has `one and `two and `three unclosed", TextType.TEXT)
+        node = TextNode("This has `one and `two and `three unclosed", _TEXT)
         with self.assertRaises(ValueError):
-            split_nodes_delimiter([node], "`", TextType.CODE)
-
-    def test_split_empty_text_node(self):
-        node = TextNode("", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = []
-        self.assertEqual(new_nodes, expected)
-
-    def test_split_whitespace_only_delimiter(self):
-        node = TextNode("Text with ` ` space code", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode(" ", TextType.CODE),
-            TextNode(" space code", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
-
-    def test_split_consecutive_delimiters(self):
-        node = TextNode("Text with `first``second` consecutive", TextType.TEXT)
-        new_nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("first", TextType.CODE),
-            TextNode("second", TextType.CODE),
-            TextNode(" consecutive", TextType.TEXT),
-        ]
-        self.assertEqual(new_nodes, expected)
-
-
-class TestExtractMarkdownImages(unittest.TestCase):
-    def test_extract_markdown_images(self):
-        matches = extract_markdown_images(
-            "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)"
-        )
-        self.assertListEqual([("image", "https://i.imgur.com/zjjcJKZ.png")], matches)
-
-    def test_extract_multiple_images(self):
-        text = "This is text with a ![rick roll](https://i.imgur.com/aKaOqIh.gif) and ![obi wan](https://i.imgur.com/fJRm4Vk.jpeg)"
-        matches = extract_markdown_images(text)
-        expected = [("rick roll", "https://i.imgur.com/aKaOqIh.gif"), ("obi wan", "https://i.imgur.com/fJRm4Vk.jpeg")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_no_images(self):
-        text = "This is text with no images"
-        matches = extract_markdown_images(text)
-        self.assertListEqual([], matches)
-
-    def test_extract_empty_alt_text(self):
-        text = "This has an image with empty alt text ![](https://example.com/image.png)"
-        matches = extract_markdown_images(text)
-        expected = [("", "https://example.com/image.png")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_complex_alt_text(self):
-        text = "Image with spaces ![my awesome image](https://example.com/image.png)"
-        matches = extract_markdown_images(text)
-        expected = [("my awesome image", "https://example.com/image.png")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_image_with_special_chars_in_url(self):
-        text = "Image with special chars ![test](https://example.com/path/to/image.png?param=value&other=123)"
-        matches = extract_markdown_images(text)
-        expected = [("test", "https://example.com/path/to/image.png?param=value&other=123")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_image_mixed_with_links(self):
-        text = "Text with ![image](https://i.imgur.com/image.png) and [link](https://example.com)"
-        matches = extract_markdown_images(text)
-        expected = [("image", "https://i.imgur.com/image.png")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_image_at_start_and_end(self):
-        text = "![start](https://example.com/start.png) middle text ![end](https://example.com/end.png)"
-        matches = extract_markdown_images(text)
-        expected = [("start", "https://example.com/start.png"), ("end", "https://example.com/end.png")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_image_with_numbers_in_alt(self):
-        text = "Image with numbers ![image123](https://example.com/123.png)"
-        matches = extract_markdown_images(text)
-        expected = [("image123", "https://example.com/123.png")]
-        self.assertListEqual(expected, matches)
-
-
-class TestExtractMarkdownLinks(unittest.TestCase):
-    def test_extract_markdown_links(self):
-        text = "This is text with a link [to boot dev](https://www.boot.dev) and [to youtube](https://www.youtube.com/@bootdotdev)"
-        matches = extract_markdown_links(text)
-        expected = [("to boot dev", "https://www.boot.dev"), ("to youtube", "https://www.youtube.com/@bootdotdev")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_single_link(self):
-        text = "Check out this [awesome site](https://example.com)"
-        matches = extract_markdown_links(text)
-        expected = [("awesome site", "https://example.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_no_links(self):
-        text = "This is text with no links"
-        matches = extract_markdown_links(text)
-        self.assertListEqual([], matches)
-
-    def test_extract_empty_anchor_text(self):
-        text = "This has a link with empty anchor text [](https://example.com)"
-        matches = extract_markdown_links(text)
-        expected = [("", "https://example.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_link_with_special_chars(self):
-        text = "Link with special chars [test-link_123](https://example.com/path?param=value&other=123)"
-        matches = extract_markdown_links(text)
-        expected = [("test-link_123", "https://example.com/path?param=value&other=123")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_link_mixed_with_images(self):
-        text = "Text with [link](https://example.com) and ![image](https://i.imgur.com/image.png)"
-        matches = extract_markdown_links(text)
-        expected = [("link", "https://example.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_multiple_links_same_line(self):
-        text = "Multiple [first](https://one.com) and [second](https://two.com) and [third](https://three.com) links"
-        matches = extract_markdown_links(text)
-        expected = [("first", "https://one.com"), ("second", "https://two.com"), ("third", "https://three.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_link_at_start_and_end(self):
-        text = "[start](https://start.com) middle text [end](https://end.com)"
-        matches = extract_markdown_links(text)
-        expected = [("start", "https://start.com"), ("end", "https://end.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_link_with_spaces_in_anchor(self):
-        text = "Link with spaces [my awesome link](https://example.com)"
-        matches = extract_markdown_links(text)
-        expected = [("my awesome link", "https://example.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_link_ignores_images(self):
-        text = "Should not match images ![not a link](https://example.com) but should match [actual link](https://example.com)"
-        matches = extract_markdown_links(text)
-        expected = [("actual link", "https://example.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_adjacent_image_and_link(self):
-        text = "Adjacent ![image](https://img.com)[link](https://link.com) elements"
-        matches = extract_markdown_links(text)
-        expected = [("link", "https://link.com")]
-        self.assertListEqual(expected, matches)
-
-    def test_extract_nested_brackets_in_anchor(self):
-        text = "Text with [anchor [nested]](https://example.com) test"
-        matches = extract_markdown_links(text)
-        # This should not match due to nested brackets
-        expected = []
-        self.assertListEqual(expected, matches)
-
-
-class TestSplitNodesImage(unittest.TestCase):
-    def test_split_images(self):
-        node = TextNode(
-            "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
+            split_nodes_delimiter([node], "`", _CODE)
+
+
+class TestExtractMarkdownImages(NodeAssertions, unittest.TestCase):
+    # (name, text, expected) rows consumed by one subTest loop
+    CASES = (
+        (
+            "single_image",
+            "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)",
+            [("image", "https://i.imgur.com/zjjcJKZ.png")],
+        ),
+        (
+            "multiple_images",
+            "This is text with a ![rick roll](https://i.imgur.com/aKaOqIh.gif) and ![obi wan](https://i.imgur.com/fJRm4Vk.jpeg)",
+            [("rick roll", "https://i.imgur.com/aKaOqIh.gif"), ("obi wan", "https://i.imgur.com/fJRm4Vk.jpeg")],
+        ),
+        (
+            "no_images",
+            "This is text with no images",
+            [],
+        ),
+        (
+            "empty_alt_text",
+            "This has an image with empty alt text ![](https://example.com/image.png)",
+            [("", _URL_EXAMPLE_IMAGE)],
+        ),
+        (
+            "complex_alt_text",
+            "Image with spaces ![my awesome image](https://example.com/image.png)",
+            [("my awesome image", _URL_EXAMPLE_IMAGE)],
+        ),
+        (
+            "special_chars_in_url",
+            "Image with special chars ![test](https://example.com/path/to/image.png?param=value&other=123)",
+            [("test", "https://example.com/path/to/image.png?param=value&other=123")],
+        ),
+        (
+            "mixed_with_links",
+            "Text with ![image](https://i.imgur.com/image.png) and [link](https://example.com)",
+            [("image", "https://i.imgur.com/image.png")],
+        ),
+        (
+            "image_at_start_and_end",
+            "![start](https://example.com/start.png) middle text ![end](https://example.com/end.png)",
+            [("start", "https://example.com/start.png"), ("end", "https://example.com/end.png")],
+        ),
+        (
+            "numbers_in_alt",
+            "Image with numbers ![image123](https://example.com/123.png)",
+            [("image123", "https://example.com/123.png")],
+        ),
+    )
+
+    def test_extract_markdown_images_cases(self):
+        for name, text, expected in self.CASES:
+            with self.subTest(case=name):
+                self.assertNodes(extract_markdown_images(text), expected)
+
+
+class TestExtractMarkdownLinks(NodeAssertions, unittest.TestCase):
+    # (name, text, expected) rows consumed by one subTest loop
+    CASES = (
+        (
+            "multiple_links",
+            "This is text with a link [to boot dev](https://www.boot.dev) and [to youtube](https://www.youtube.com/@bootdotdev)",
+            [("to boot dev", "https://www.boot.dev"), ("to youtube", "https://www.youtube.com/@bootdotdev")],
+        ),
+        (
+            "single_link",
+            "Check out this [awesome site](https://example.com)",
+            [("awesome site", _URL_EXAMPLE)],
+        ),
+        (
+            "no_links",
+            "This is text with no links",
+            [],
+        ),
+        (
+            "empty_anchor_text",
+            "This has a link with empty anchor text [](https://example.com)",
+            [("", _URL_EXAMPLE)],
+        ),
+        (
+            "special_chars",
+            "Link with special chars [test-link_123](https://example.com/path?param=value&other=123)",
+            [("test-link_123", "https://example.com/path?param=value&other=123")],
+        ),
+        (
+            "mixed_with_images",
+            "Text with [link](https://example.com) and ![image](https://i.imgur.com/image.png)",
+            [("link", _URL_EXAMPLE)],
+        ),
+        (
+            "multiple_links_same_line",
+            "Multiple [first](https://one.com) and [second](https://two.com) and [third](https://three.com) links",
+            [("first", "https://one.com"), ("second", "https://two.com"), ("third", "https://three.com")],
+        ),
+        (
+            "link_at_start_and_end",
+            "[start](https://start.com) middle text [end](https://end.com)",
+            [("start", "https://start.com"), ("end", "https://end.com")],
+        ),
+        (
+            "spaces_in_anchor",
+            "Link with spaces [my awesome link](https://example.com)",
+            [("my awesome link", _URL_EXAMPLE)],
+        ),
+        (
+            "ignores_images",
+            "Should not match images ![not a link](https://example.com) but should match [actual link](https://example.com)",
+            [("actual link", _URL_EXAMPLE)],
+        ),
+        (
+            "adjacent_image_and_link",
+            "Adjacent ![image](https://img.com)[link](https://link.com) elements",
+            [("link", "https://link.com")],
+        ),
+        (
+            # Nested brackets invalidate the anchor, so nothing should match
+            "nested_brackets_in_anchor",
+            "Text with [anchor [nested]](https://example.com) test",
+            [],
+        ),
+    )
+
+    def test_extract_markdown_links_cases(self):
+        for name, text, expected in self.CASES:
+            with self.subTest(case=name):
+                self.assertNodes(extract_markdown_links(text), expected)
+
+
+class TestSplitNodesImage(NodeAssertions, unittest.TestCase):
+    # (name, input nodes, expected) rows consumed by one subTest loop
+    CASES = (
+        (
+            "two_images",
+            (TextNode(
+                "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)",
+                _TEXT,
+            ),),
             [
-                TextNode("This is text with an ", TextType.TEXT),
-                TextNode("image", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
-                TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"
-                ),
+                TextNode("This is text with an ", _TEXT),
+                TextNode("image", _IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
+                TextNode(" and another ", _TEXT),
+                TextNode("second image", _IMAGE, "https://i.imgur.com/3elNhQu.png"),
             ],
-            new_nodes,
-        )
-
-    def test_split_single_image(self):
-        node = TextNode("Text with ![single image](https://example.com/image.png) here", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("single image", TextType.IMAGE, "https://example.com/image.png"),
-            TextNode(" here", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_image_at_start(self):
-        node = TextNode("![start image](https://example.com/start.png) text after", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [
-            TextNode("start image", TextType.IMAGE, "https://example.com/start.png"),
-            TextNode(" text after", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_image_at_end(self):
-        node = TextNode("Text before ![end image](https://example.com/end.png)", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [
-            TextNode("Text before ", TextType.TEXT),
-            TextNode("end image", TextType.IMAGE, "https://example.com/end.png"),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_image_only(self):
-        node = TextNode("![only image](https://example.com/only.png)", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [
-            TextNode("only image", TextType.IMAGE, "https://example.com/only.png"),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_no_images(self):
-        node = TextNode("This is text with no images", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [node]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_non_text_node(self):
-        node = TextNode("Already bold", TextType.BOLD)
-        new_nodes = split_nodes_image([node])
-        expected = [node]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_empty_text_node(self):
-        node = TextNode("", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = []
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_multiple_nodes_mixed(self):
-        nodes = [
-            TextNode("Text with ![image1](https://example.com/1.png) here", TextType.TEXT),
-            TextNode("Already bold", TextType.BOLD),
-            TextNode("More text with ![image2](https://example.com/2.png) there", TextType.TEXT),
-        ]
-        new_nodes = split_nodes_image(nodes)
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("image1", TextType.IMAGE, "https://example.com/1.png"),
-            TextNode(" here", TextType.TEXT),
-            TextNode("Already bold", TextType.BOLD),
-            TextNode("More text with ", TextType.TEXT),
-            TextNode("image2", TextType.IMAGE, "https://example.com/2.png"),
-            TextNode(" there", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_image_empty_alt_text(self):
-        node = TextNode("Text with ![](https://example.com/empty.png) image", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("", TextType.IMAGE, "https://example.com/empty.png"),
-            TextNode(" image", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_consecutive_images(self):
-        node = TextNode("![first](https://example.com/1.png)![second](https://example.com/2.png)", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [
-            TextNode("first", TextType.IMAGE, "https://example.com/1.png"),
-            TextNode("second", TextType.IMAGE, "https://example.com/2.png"),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_image_with_links(self):
-        node = TextNode("Text with ![image](https://example.com/img.png) and [link](https://example.com)", TextType.TEXT)
-        new_nodes = split_nodes_image([node])
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("image", TextType.IMAGE, "https://example.com/img.png"),
-            TextNode(" and [link](https://example.com)", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
+        ),
+        (
+            "single_image",
+            (TextNode("Text with ![single image](https://example.com/image.png) here", _TEXT),),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("single image", _IMAGE, _URL_EXAMPLE_IMAGE),
+                TextNode(" here", _TEXT),
+            ],
+        ),
+        (
+            "image_at_start",
+            (TextNode("![start image](https://example.com/start.png) text after", _TEXT),),
+            [
+                TextNode("start image", _IMAGE, "https://example.com/start.png"),
+                TextNode(" text after", _TEXT),
+            ],
+        ),
+        (
+            "image_at_end",
+            (TextNode("Text before ![end image](https://example.com/end.png)", _TEXT),),
+            [
+                TextNode("Text before ", _TEXT),
+                TextNode("end image", _IMAGE, "https://example.com/end.png"),
+            ],
+        ),
+        (
+            "image_only",
+            (TextNode("![only image](https://example.com/only.png)", _TEXT),),
+            [TextNode("only image", _IMAGE, "https://example.com/only.png")],
+        ),
+        (
+            "no_images",
+            (TextNode("This is text with no images", _TEXT),),
+            [TextNode("This is text with no images", _TEXT)],
+        ),
+        (
+            "non_text_node",
+            (TextNode("Already bold", _BOLD),),
+            [TextNode("Already bold", _BOLD)],
+        ),
+        (
+            "empty_text_node",
+            (TextNode("", _TEXT),),
+            [],
+        ),
+        (
+            "multiple_nodes_mixed",
+            (
+                TextNode("Text with ![image1](https://example.com/1.png) here", _TEXT),
+                TextNode("Already bold", _BOLD),
+                TextNode("More text with ![image2](https://example.com/2.png) there", _TEXT),
+            ),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("image1", _IMAGE, "https://example.com/1.png"),
+                TextNode(" here", _TEXT),
+                TextNode("Already bold", _BOLD),
+                TextNode("More text with ", _TEXT),
+                TextNode("image2", _IMAGE, "https://example.com/2.png"),
+                TextNode(" there", _TEXT),
+            ],
+        ),
+        (
+            "empty_alt_text",
+            (TextNode("Text with ![](https://example.com/empty.png) image", _TEXT),),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("", _IMAGE, "https://example.com/empty.png"),
+                TextNode(" image", _TEXT),
+            ],
+        ),
+        (
+            "consecutive_images",
+            (TextNode("![first](https://example.com/1.png)![second](https://example.com/2.png)", _TEXT),),
+            [
+                TextNode("first", _IMAGE, "https://example.com/1.png"),
+                TextNode("second", _IMAGE, "https://example.com/2.png"),
+            ],
+        ),
+        (
+            "leaves_links_alone",
+            (TextNode("Text with ![image](https://example.com/img.png) and [link](https://example.com)", _TEXT),),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("image", _IMAGE, _URL_EXAMPLE_IMG),
+                TextNode(" and [link](https://example.com)", _TEXT),
+            ],
+        ),
+    )
+
+    def test_split_nodes_image_cases(self):
+        for name, nodes, expected in self.CASES:
+            with self.subTest(case=name):
+                self.assertNodes(split_nodes_image(list(nodes)), expected)
+
+
+class TestSplitNodesLink(NodeAssertions, unittest.TestCase):
+    # (name, input nodes, expected) rows consumed by one subTest loop
+    CASES = (
+        (
+            "two_links",
+            (TextNode(
+                "This is text with a link [to boot dev](https://www.boot.dev) and [to youtube](https://www.youtube.com/@bootdotdev)",
+                _TEXT,
+            ),),
+            [
+                TextNode("This is text with a link ", _TEXT),
+                TextNode("to boot dev", _LINK, "https://www.boot.dev"),
+                TextNode(" and ", _TEXT),
+                TextNode("to youtube", _LINK, "https://www.youtube.com/@bootdotdev"),
+            ],
+        ),
+        (
+            "single_link",
+            (TextNode("Text with [single link](https://example.com) here", _TEXT),),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("single link", _LINK, _URL_EXAMPLE),
+                TextNode(" here", _TEXT),
+            ],
+        ),
+        (
+            "link_at_start",
+            (TextNode("[start link](https://example.com/start) text after", _TEXT),),
+            [
+                TextNode("start link", _LINK, "https://example.com/start"),
+                TextNode(" text after", _TEXT),
+            ],
+        ),
+        (
+            "link_at_end",
+            (TextNode("Text before [end link](https://example.com/end)", _TEXT),),
+            [
+                TextNode("Text before ", _TEXT),
+                TextNode("end link", _LINK, "https://example.com/end"),
+            ],
+        ),
+        (
+            "link_only",
+            (TextNode("[only link](https://example.com/only)", _TEXT),),
+            [TextNode("only link", _LINK, "https://example.com/only")],
+        ),
+        (
+            "no_links",
+            (TextNode("This is text with no links", _TEXT),),
+            [TextNode("This is text with no links", _TEXT)],
+        ),
+        (
+            "non_text_node",
+            (TextNode("Already bold", _BOLD),),
+            [TextNode("Already bold", _BOLD)],
+        ),
+        (
+            "empty_text_node",
+            (TextNode("", _TEXT),),
+            [],
+        ),
+        (
+            "multiple_nodes_mixed",
+            (
+                TextNode("Text with [link1](https://example.com/1) here", _TEXT),
+                TextNode("Already bold", _BOLD),
+                TextNode("More text with [link2](https://example.com/2) there", _TEXT),
+            ),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("link1", _LINK, "https://example.com/1"),
+                TextNode(" here", _TEXT),
+                TextNode("Already bold", _BOLD),
+                TextNode("More text with ", _TEXT),
+                TextNode("link2", _LINK, "https://example.com/2"),
+                TextNode(" there", _TEXT),
+            ],
+        ),
+        (
+            "empty_anchor_text",
+            (TextNode("Text with [](https://example.com/empty) link", _TEXT),),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("", _LINK, "https://example.com/empty"),
+                TextNode(" link", _TEXT),
+            ],
+        ),
+        (
+            "consecutive_links",
+            (TextNode("[first](https://example.com/1)[second](https://example.com/2)", _TEXT),),
+            [
+                TextNode("first", _LINK, "https://example.com/1"),
+                TextNode("second", _LINK, "https://example.com/2"),
+            ],
+        ),
+        (
+            "leaves_images_alone",
+            (TextNode("Text with [link](https://example.com) and ![image](https://example.com/img.png)", _TEXT),),
+            [
+                TextNode("Text with ", _TEXT),
+                TextNode("link", _LINK, _URL_EXAMPLE),
+                TextNode(" and ![image](https://example.com/img.png)", _TEXT),
+            ],
+        ),
+        (
+            "ignores_images",
+            (TextNode("Text with ![not link](https://example.com) and [actual link](https://example.com)", _TEXT),),
+            [
+                TextNode("Text with ![not link](https://example.com) and ", _TEXT),
+                TextNode("actual link", _LINK, _URL_EXAMPLE),
+            ],
+        ),
+        (
+            "special_chars",
+            (TextNode("Link with [special-chars_123](https://example.com/path?param=value&other=123) text", _TEXT),),
+            [
+                TextNode("Link with ", _TEXT),
+                TextNode("special-chars_123", _LINK, "https://example.com/path?param=value&other=123"),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "mixed_images_and_links",
+            (TextNode("Text ![img](https://img.com) and [link](https://link.com) mixed", _TEXT),),
+            [
+                TextNode("Text ![img](https://img.com) and ", _TEXT),
+                TextNode("link", _LINK, "https://link.com"),
+                TextNode(" mixed", _TEXT),
+            ],
+        ),
+    )
 
+    def test_split_nodes_link_cases(self):
+        for name, nodes, expected in self.CASES:
+            with self.subTest(case=name):
+                self.assertNodes(split_nodes_link(list(nodes)), expected)
 
-class TestSplitNodesLink(unittest.TestCase):
-    def test_split_links(self):
-        node = TextNode(
-            "This is text with a link [to boot dev](https://www.boot.dev) and [to youtube](https://www.youtube.com/@bootdotdev)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("This is text with a link ", TextType.TEXT),
-            TextNode("to boot dev", TextType.LINK, "https://www.boot.dev"),
-            TextNode(" and ", TextType.TEXT),
-            TextNode("to youtube", TextType.LINK, "https://www.youtube.com/@bootdotdev"),
-        ]
-        self.assertListEqual(expected, new_nodes)
 
-    def test_split_single_link(self):
-        node = TextNode("Text with [single link](https://example.com) here", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("single link", TextType.LINK, "https://example.com"),
-            TextNode(" here", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
+class TestTextToTextNodes(NodeAssertions, unittest.TestCase):
+    # (name, text, expected) rows consumed by one subTest loop
+    CASES = (
+        (
+            "full_example",
+            "This is **text** with an *italic* word and a `code block` and an ![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("text", _BOLD),
+                TextNode(" with an ", _TEXT),
+                TextNode("italic", _ITALIC),
+                TextNode(" word and a ", _TEXT),
+                TextNode("code block", _CODE),
+                TextNode(" and an ", _TEXT),
+                TextNode("obi wan image", _IMAGE, "https://i.imgur.com/fJRm4Vk.jpeg"),
+                TextNode(" and a ", _TEXT),
+                TextNode("link", _LINK, "https://boot.dev"),
+            ],
+        ),
+        (
+            "plain_text",
+            "This is just plain text with no formatting",
+            [TextNode("This is just plain text with no formatting", _TEXT)],
+        ),
+        (
+            "only_bold",
+            "This is **bold** text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("bold", _BOLD),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "only_italic",
+            "This is *italic* text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("italic", _ITALIC),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "only_code",
+            "This is `code` text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("code", _CODE),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "only_image",
+            "This is ![image](https://example.com/image.png) text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("image", _IMAGE, _URL_EXAMPLE_IMAGE),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "only_link",
+            "This is [link](https://example.com) text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("link", _LINK, _URL_EXAMPLE),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "multiple_same_type",
+            "This is **bold** and **more bold** text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("bold", _BOLD),
+                TextNode(" and ", _TEXT),
+                TextNode("more bold", _BOLD),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "nested_formatting",
+            "This is **bold with `code` inside** text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("bold with `code` inside", _BOLD),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "separate_formatting",
+            "This is **bold** and `code` text",
+            [
+                TextNode("This is ", _TEXT),
+                TextNode("bold", _BOLD),
+                TextNode(" and ", _TEXT),
+                TextNode("code", _CODE),
+                TextNode(" text", _TEXT),
+            ],
+        ),
+        (
+            "mixed_images_and_links",
+            "Check out ![image](https://example.com/img.png) and [link](https://example.com)",
+            [
+                TextNode("Check out ", _TEXT),
+                TextNode("image", _IMAGE, _URL_EXAMPLE_IMG),
+                TextNode(" and ", _TEXT),
+                TextNode("link", _LINK, _URL_EXAMPLE),
+            ],
+        ),
+        (
+            "consecutive_formatting",
+            "**bold***italic*`code`",
+            [
+                TextNode("bold", _BOLD),
+                TextNode("italic", _ITALIC),
+                TextNode("code", _CODE),
+            ],
+        ),
+        (
+            "all_at_start",
+            "**bold** *italic* `code` ![image](https://example.com/img.png) [link](https://example.com) end",
+            [
+                TextNode("bold", _BOLD),
+                TextNode(" ", _TEXT),
+                TextNode("italic", _ITALIC),
+                TextNode(" ", _TEXT),
+                TextNode("code", _CODE),
+                TextNode(" ", _TEXT),
+                TextNode("image", _IMAGE, _URL_EXAMPLE_IMG),
+                TextNode(" ", _TEXT),
+                TextNode("link", _LINK, _URL_EXAMPLE),
+                TextNode(" end", _TEXT),
+            ],
+        ),
+        (
+            "complex_mixed",
+            "Start **bold** then *italic* with `code` and ![img](https://img.com) plus [link](https://link.com) end",
+            [
+                TextNode("Start ", _TEXT),
+                TextNode("bold", _BOLD),
+                TextNode(" then ", _TEXT),
+                TextNode("italic", _ITALIC),
+                TextNode(" with ", _TEXT),
+                TextNode("code", _CODE),
+                TextNode(" and ", _TEXT),
+                TextNode("img", _IMAGE, "https://img.com"),
+                TextNode(" plus ", _TEXT),
+                TextNode("link", _LINK, "https://link.com"),
+                TextNode(" end", _TEXT),
+            ],
+        ),
+        (
+            "empty_text",
+            "",
+            [],
+        ),
+        (
+            "whitespace_only",
+            "   ",
+            [TextNode("   ", _TEXT)],
+        ),
+        (
+            "single_character_formatting",
+            "A **b** c",
+            [
+                TextNode("A ", _TEXT),
+                TextNode("b", _BOLD),
+                TextNode(" c", _TEXT),
+            ],
+        ),
+    )
 
-    def test_split_link_at_start(self):
-        node = TextNode("[start link](https://example.com/start) text after", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("start link", TextType.LINK, "https://example.com/start"),
-            TextNode(" text after", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
+    def test_text_to_textnodes_cases(self):
+        for name, text, expected in self.CASES:
+            with self.subTest(case=name):
+                self.assertNodes(text_to_textnodes(text), expected)
 
-    def test_split_link_at_end(self):
-        node = TextNode("Text before [end link](https://example.com/end)", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("Text before ", TextType.TEXT),
-            TextNode("end link", TextType.LINK, "https://example.com/end"),
-        ]
-        self.assertListEqual(expected, new_nodes)
 
-    def test_split_link_only(self):
-        node = TextNode("[only link](https://example.com/only)", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("only link", TextType.LINK, "https://example.com/only"),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_no_links(self):
-        node = TextNode("This is text with no links", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [node]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_non_text_node(self):
-        node = TextNode("Already bold", TextType.BOLD)
-        new_nodes = split_nodes_link([node])
-        expected = [node]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_empty_text_node(self):
-        node = TextNode("", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = []
-        self.assertListEqual(expected, new_nodes)
+class TestTextBatch(unittest.TestCase):
+    def test_from_text_round_trip(self):
+        text = "This is **bold** with a [link](https://example.com)"
+        batch = TextBatch.from_text(text)
+        self.assertListEqual(batch.to_nodes(), text_to_textnodes(text))
 
-    def test_split_multiple_nodes_mixed(self):
+    def test_from_nodes_round_trip(self):
         nodes = [
-            TextNode("Text with [link1](https://example.com/1) here", TextType.TEXT),
-            TextNode("Already bold", TextType.BOLD),
-            TextNode("More text with [link2](https://example.com/2) there", TextType.TEXT),
-        ]
-        new_nodes = split_nodes_link(nodes)
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("link1", TextType.LINK, "https://example.com/1"),
-            TextNode(" here", TextType.TEXT),
-            TextNode("Already bold", TextType.BOLD),
-            TextNode("More text with ", TextType.TEXT),
-            TextNode("link2", TextType.LINK, "https://example.com/2"),
-            TextNode(" there", TextType.TEXT),
+            TextNode("plain ", _TEXT),
+            TextNode("code", _CODE),
+            TextNode("alt", _IMAGE, _URL_EXAMPLE_IMG),
         ]
-        self.assertListEqual(expected, new_nodes)
+        batch = TextBatch.from_nodes(nodes)
+        self.assertListEqual(batch.to_nodes(), nodes)
 
-    def test_split_link_empty_anchor_text(self):
-        node = TextNode("Text with [](https://example.com/empty) link", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("", TextType.LINK, "https://example.com/empty"),
-            TextNode(" link", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
+    def test_len(self):
+        batch = TextBatch.from_text("a **b** c")
+        self.assertEqual(len(batch), 3)
 
-    def test_split_consecutive_links(self):
-        node = TextNode("[first](https://example.com/1)[second](https://example.com/2)", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("first", TextType.LINK, "https://example.com/1"),
-            TextNode("second", TextType.LINK, "https://example.com/2"),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_link_with_images(self):
-        node = TextNode("Text with [link](https://example.com) and ![image](https://example.com/img.png)", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("Text with ", TextType.TEXT),
-            TextNode("link", TextType.LINK, "https://example.com"),
-            TextNode(" and ![image](https://example.com/img.png)", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_link_ignores_images(self):
-        node = TextNode("Text with ![not link](https://example.com) and [actual link](https://example.com)", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("Text with ![not link](https://example.com) and ", TextType.TEXT),
-            TextNode("actual link", TextType.LINK, "https://example.com"),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_link_with_special_chars(self):
-        node = TextNode("Link with [special-chars_123](https://example.com/path?param=value&other=123) text", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("Link with ", TextType.TEXT),
-            TextNode("special-chars_123", TextType.LINK, "https://example.com/path?param=value&other=123"),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-    def test_split_mixed_images_and_links(self):
-        node = TextNode("Text ![img](https://img.com) and [link](https://link.com) mixed", TextType.TEXT)
-        new_nodes = split_nodes_link([node])
-        expected = [
-            TextNode("Text ![img](https://img.com) and ", TextType.TEXT),
-            TextNode("link", TextType.LINK, "https://link.com"),
-            TextNode(" mixed", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, new_nodes)
-
-
-class TestTextToTextNodes(unittest.TestCase):
-    def test_text_to_textnodes_full_example(self):
-        text = "This is **text** with an *italic* word and a `code block` and an ![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("text", TextType.BOLD),
-            TextNode(" with an ", TextType.TEXT),
-            TextNode("italic", TextType.ITALIC),
-            TextNode(" word and a ", TextType.TEXT),
-            TextNode("code block", TextType.CODE),
-            TextNode(" and an ", TextType.TEXT),
-            TextNode("obi wan image", TextType.IMAGE, "https://i.imgur.com/fJRm4Vk.jpeg"),
-            TextNode(" and a ", TextType.TEXT),
-            TextNode("link", TextType.LINK, "https://boot.dev"),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_plain_text(self):
-        text = "This is just plain text with no formatting"
-        nodes = text_to_textnodes(text)
-        expected = [TextNode("This is just plain text with no formatting", TextType.TEXT)]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_only_bold(self):
-        text = "This is **bold** text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("bold", TextType.BOLD),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_only_italic(self):
-        text = "This is *italic* text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("italic", TextType.ITALIC),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_only_code(self):
-        text = "This is `code` text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("code", TextType.CODE),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_only_image(self):
-        text = "This is ![image](https://example.com/image.png) text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("image", TextType.IMAGE, "https://example.com/image.png"),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_only_link(self):
-        text = "This is [link](https://example.com) text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("link", TextType.LINK, "https://example.com"),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
+    def test_empty_text(self):
+        batch = TextBatch.from_text("")
+        self.assertEqual(len(batch), 0)
+        self.assertListEqual(batch.to_nodes(), [])
 
-    def test_text_to_textnodes_multiple_same_type(self):
-        text = "This is **bold** and **more bold** text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("bold", TextType.BOLD),
-            TextNode(" and ", TextType.TEXT),
-            TextNode("more bold", TextType.BOLD),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_nested_formatting(self):
-        text = "This is **bold with `code` inside** text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("bold with `code` inside", TextType.BOLD),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_separate_formatting(self):
-        text = "This is **bold** and `code` text"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("This is ", TextType.TEXT),
-            TextNode("bold", TextType.BOLD),
-            TextNode(" and ", TextType.TEXT),
-            TextNode("code", TextType.CODE),
-            TextNode(" text", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_mixed_images_and_links(self):
-        text = "Check out ![image](https://example.com/img.png) and [link](https://example.com)"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("Check out ", TextType.TEXT),
-            TextNode("image", TextType.IMAGE, "https://example.com/img.png"),
-            TextNode(" and ", TextType.TEXT),
-            TextNode("link", TextType.LINK, "https://example.com"),
-        ]
-        self.assertListEqual(expected, nodes)
+    def test_batch_equality(self):
+        text = "Some **bold** and a [link](https://example.com)"
+        self.assertEqual(TextBatch.from_text(text), TextBatch.from_text(text))
+        self.assertNotEqual(TextBatch.from_text(text), TextBatch.from_text("other"))
 
-    def test_text_to_textnodes_consecutive_formatting(self):
-        text = "**bold***italic*`code`"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("bold", TextType.BOLD),
-            TextNode("italic", TextType.ITALIC),
-            TextNode("code", TextType.CODE),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_all_at_start(self):
-        text = "**bold** *italic* `code` ![image](https://example.com/img.png) [link](https://example.com) end"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("bold", TextType.BOLD),
-            TextNode(" ", TextType.TEXT),
-            TextNode("italic", TextType.ITALIC),
-            TextNode(" ", TextType.TEXT),
-            TextNode("code", TextType.CODE),
-            TextNode(" ", TextType.TEXT),
-            TextNode("image", TextType.IMAGE, "https://example.com/img.png"),
-            TextNode(" ", TextType.TEXT),
-            TextNode("link", TextType.LINK, "https://example.com"),
-            TextNode(" end", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_complex_mixed(self):
-        text = "Start **bold** then *italic* with `code` and ![img](https://img.com) plus [link](https://link.com) end"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("Start ", TextType.TEXT),
-            TextNode("bold", TextType.BOLD),
-            TextNode(" then ", TextType.TEXT),
-            TextNode("italic", TextType.ITALIC),
-            TextNode(" with ", TextType.TEXT),
-            TextNode("code", TextType.CODE),
-            TextNode(" and ", TextType.TEXT),
-            TextNode("img", TextType.IMAGE, "https://img.com"),
-            TextNode(" plus ", TextType.TEXT),
-            TextNode("link", TextType.LINK, "https://link.com"),
-            TextNode(" end", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_empty_text(self):
-        text = ""
-        nodes = text_to_textnodes(text)
-        expected = []
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_whitespace_only(self):
-        text = "   "
-        nodes = text_to_textnodes(text)
-        expected = [TextNode("   ", TextType.TEXT)]
-        self.assertListEqual(expected, nodes)
-
-    def test_text_to_textnodes_single_character_formatting(self):
-        text = "A **b** c"
-        nodes = text_to_textnodes(text)
-        expected = [
-            TextNode("A ", TextType.TEXT),
-            TextNode("b", TextType.BOLD),
-            TextNode(" c", TextType.TEXT),
-        ]
-        self.assertListEqual(expected, nodes)
+    def test_iter_yields_nodes(self):
+        text = "a `code` b"
+        self.assertListEqual(list(TextBatch.from_text(text)), text_to_textnodes(text))
 
 
 class TestMarkdownToBlocks(unittest.TestCase):
@@ -959,175 +1023,49 @@ Here too"""
 
 
 class TestBlockToBlockType(unittest.TestCase):
-    def test_block_to_block_type_heading_h1(self):
-        block = "# This is a heading"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.HEADING, block_type)
-
-    def test_block_to_block_type_heading_h2(self):
-        block = "## This is a heading"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.HEADING, block_type)
-
-    def test_block_to_block_type_heading_h6(self):
-        block = "###### This is a heading"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.HEADING, block_type)
-
-    def test_block_to_block_type_heading_invalid_too_many_hashes(self):
-        block = "####### This is not a heading"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_heading_no_space(self):
-        block = "#This is not a heading"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_code_block(self):
-        block = "```python\nprint('Hello')\n```"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.CODE, block_type)
-
-    def test_block_to_block_type_code_block_empty(self):
-        block = "```\n```"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.CODE, block_type)
-
-    def test_block_to_block_type_code_block_single_line(self):
-        block = "```code```"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.CODE, block_type)
-
-    def test_block_to_block_type_code_block_no_end(self):
-        block = "```python\nprint('Hello')"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_quote_single_line(self):
-        block = "> This is a quote"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.QUOTE, block_type)
-
-    def test_block_to_block_type_quote_multiple_lines(self):
-        block = "> This is a quote\n> that spans multiple lines"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.QUOTE, block_type)
-
-    def test_block_to_block_type_quote_mixed_lines(self):
-        block = "> This is a quote\nThis is not"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_unordered_list_single_item(self):
-        block = "- This is a list item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.UNORDERED_LIST, block_type)
-
-    def test_block_to_block_type_unordered_list_multiple_items(self):
-        block = "- First item\n- Second item\n- Third item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.UNORDERED_LIST, block_type)
-
-    def test_block_to_block_type_unordered_list_no_space(self):
-        block = "-This is not a list item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_unordered_list_mixed_lines(self):
-        block = "- This is a list item\nThis is not"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_ordered_list_single_item(self):
-        block = "1. This is a list item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.ORDERED_LIST, block_type)
-
-    def test_block_to_block_type_ordered_list_multiple_items(self):
-        block = "1. First item\n2. Second item\n3. Third item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.ORDERED_LIST, block_type)
-
-    def test_block_to_block_type_ordered_list_wrong_numbering(self):
-        block = "1. First item\n3. Third item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_ordered_list_not_starting_with_1(self):
-        block = "2. Second item\n3. Third item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_ordered_list_no_space(self):
-        block = "1.This is not a list item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_ordered_list_mixed_lines(self):
-        block = "1. This is a list item\nThis is not"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_paragraph_plain_text(self):
-        block = "This is just a regular paragraph"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_paragraph_multiple_lines(self):
-        block = "This is a paragraph\nthat spans multiple lines"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_paragraph_with_formatting(self):
-        block = "This is a paragraph with **bold** and *italic* text"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_paragraph_hash_in_middle(self):
-        block = "This # is not a heading"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_paragraph_backticks_in_middle(self):
-        block = "This has ```code``` in the middle"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_paragraph_quote_in_middle(self):
-        block = "This has > quote in the middle"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_paragraph_dash_in_middle(self):
-        block = "This has - dash in the middle"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_empty_lines_in_ordered_list(self):
-        block = "1. First item\n\n2. Second item"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.PARAGRAPH, block_type)
-
-    def test_block_to_block_type_quote_with_space_after(self):
-        block = "> This is a quote\n> with proper spacing"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.QUOTE, block_type)
-
-    def test_block_to_block_type_code_block_with_language(self):
-        block = "```python\ndef hello():\n    print('Hello')\n```"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.CODE, block_type)
-
-    def test_block_to_block_type_heading_with_multiple_words(self):
-        block = "### This is a longer heading with multiple words"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.HEADING, block_type)
-
-    def test_block_to_block_type_ordered_list_double_digits(self):
-        block = "1. First\n2. Second\n3. Third\n4. Fourth\n5. Fifth\n6. Sixth\n7. Seventh\n8. Eighth\n9. Ninth\n10. Tenth"
-        block_type = block_to_block_type(block)
-        self.assertEqual(BlockType.ORDERED_LIST, block_type)
+    # (name, block, expected BlockType) rows consumed by one subTest loop
+    CASES = (
+        ("heading_h1", "# This is a heading", BlockType.HEADING),
+        ("heading_h2", "## This is a heading", BlockType.HEADING),
+        ("heading_h6", "###### This is a heading", BlockType.HEADING),
+        ("heading_invalid_too_many_hashes", "####### This is not a heading", BlockType.PARAGRAPH),
+        ("heading_no_space", "#This is not a heading", BlockType.PARAGRAPH),
+        ("code_block", "```python\nprint('Hello')\n```", BlockType.CODE),
+        ("code_block_empty", "```\n```", BlockType.CODE),
+        ("code_block_single_line", "```code```", BlockType.CODE),
+        ("code_block_no_end", "```python\nprint('Hello')", BlockType.PARAGRAPH),
+        ("quote_single_line", "> This is a quote", BlockType.QUOTE),
+        ("quote_multiple_lines", "> This is a quote\n> that spans multiple lines", BlockType.QUOTE),
+        ("quote_mixed_lines", "> This is a quote\nThis is not", BlockType.PARAGRAPH),
+        ("unordered_list_single_item", "- This is a list item", BlockType.UNORDERED_LIST),
+        ("unordered_list_multiple_items", "- First item\n- Second item\n- Third item", BlockType.UNORDERED_LIST),
+        ("unordered_list_no_space", "-This is not a list item", BlockType.PARAGRAPH),
+        ("unordered_list_mixed_lines", "- This is a list item\nThis is not", BlockType.PARAGRAPH),
+        ("ordered_list_single_item", "1. This is a list item", BlockType.ORDERED_LIST),
+        ("ordered_list_multiple_items", "1. First item\n2. Second item\n3. Third item", BlockType.ORDERED_LIST),
+        ("ordered_list_wrong_numbering", "1. First item\n3. Third item", BlockType.PARAGRAPH),
+        ("ordered_list_not_starting_with_1", "2. Second item\n3. Third item", BlockType.PARAGRAPH),
+        ("ordered_list_no_space", "1.This is not a list item", BlockType.PARAGRAPH),
+        ("ordered_list_mixed_lines", "1. This is a list item\nThis is not", BlockType.PARAGRAPH),
+        ("paragraph_plain_text", "This is just a regular paragraph", BlockType.PARAGRAPH),
+        ("paragraph_multiple_lines", "This is a paragraph\nthat spans multiple lines", BlockType.PARAGRAPH),
+        ("paragraph_with_formatting", "This is a paragraph with **bold** and *italic* text", BlockType.PARAGRAPH),
+        ("paragraph_hash_in_middle", "This # is not a heading", BlockType.PARAGRAPH),
+        ("paragraph_backticks_in_middle", "This has ```code``` in the middle", BlockType.PARAGRAPH),
+        ("paragraph_quote_in_middle", "This has > quote in the middle", BlockType.PARAGRAPH),
+        ("paragraph_dash_in_middle", "This has - dash in the middle", BlockType.PARAGRAPH),
+        ("empty_lines_in_ordered_list", "1. First item\n\n2. Second item", BlockType.PARAGRAPH),
+        ("quote_with_space_after", "> This is a quote\n> with proper spacing", BlockType.QUOTE),
+        ("code_block_with_language", "```python\ndef hello():\n    print('Hello')\n```", BlockType.CODE),
+        ("heading_with_multiple_words", "### This is a longer heading with multiple words", BlockType.HEADING),
+        ("ordered_list_double_digits", "1. First\n2. Second\n3. Third\n4. Fourth\n5. Fifth\n6. Sixth\n7. Seventh\n8. Eighth\n9. Ninth\n10. Tenth", BlockType.ORDERED_LIST),
+    )
+
+    def test_block_type_cases(self):
+        for name, block, expected in self.CASES:
+            with self.subTest(case=name):
+                # assertIs: BlockType members are singletons
+                self.assertIs(block_to_block_type(block), expected)
 
 
 class TestMarkdownToHtmlNode(unittest.TestCase):
@@ -1342,21 +1280,18 @@ Another paragraph"""
 ### This is h3
 
 Regular paragraph text"""
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, r"^No h1 header found in markdown$"):
             extract_title(markdown)
-        self.assertEqual(str(context.exception), "No h1 header found in markdown")
 
     def test_extract_title_empty_markdown(self):
         markdown = ""
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, r"^No h1 header found in markdown$"):
             extract_title(markdown)
-        self.assertEqual(str(context.exception), "No h1 header found in markdown")
 
     def test_extract_title_hash_without_space(self):
         markdown = "#NotATitle"
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, r"^No h1 header found in markdown$"):
             extract_title(markdown)
-        self.assertEqual(str(context.exception), "No h1 header found in markdown")
 
     def test_extract_title_multiple_h1_headers(self):
         markdown = """# First Title
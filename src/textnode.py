@@ -1,14 +1,28 @@
-from enum import Enum
+# Defer annotation evaluation: field and signature annotations stay strings,
+# so nothing is resolved at import time
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+import functools
 import re
+import sys
+from typing import Optional
 
 
-class TextType(Enum):
-    TEXT = "text"
-    BOLD = "bold"
-    ITALIC = "italic"
-    CODE = "code"
-    LINK = "link"
-    IMAGE = "image"
+class TextType(IntEnum):
+    # IntEnum makes hot-path member comparisons plain C int compares
+    TEXT = 1
+    BOLD = 2
+    ITALIC = 3
+    CODE = 4
+    LINK = 5
+    IMAGE = 6
+
+    # Keep the readable "TextType.BOLD" form in reprs and logs (3.11+ IntEnum
+    # would otherwise stringify as the bare integer)
+    __str__ = Enum.__str__
 
 
 class BlockType(Enum):
@@ -20,421 +34,824 @@ class BlockType(Enum):
     ORDERED_LIST = "ordered_list"
 
 
+
+
+# Every markdown token becomes a TextNode. A frozen, slotted dataclass keeps
+# instances compact (no __dict__), makes equality one generated tuple compare
+# over the fixed field layout, and gets hashing for free so nodes can live in
+# sets and cache keys.
+@dataclass(frozen=True, slots=True, repr=False)
 class TextNode:
-    def __init__(self, text, text_type, url=None):
-        self.text = text
-        self.text_type = text_type
-        self.url = url
-    
-    def __eq__(self, other):
+    text: str
+    text_type: "TextType"
+    url: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"TextNode({self.text}, {self.text_type}, {self.url})"
+
+
+class TextBatch:
+    """
+    Structure-of-arrays view over a sequence of inline tokens.
+
+    Token fields live in three parallel sequences — texts, types (a compact
+    signed-byte array of TextType values), and urls — instead of one object
+    per token. Bulk passes can scan the contiguous type array without
+    chasing per-node attributes; TextNode objects are materialized lazily
+    via to_nodes().
+    """
+
+    __slots__ = ("texts", "types", "urls")
+
+    def __init__(self) -> None:
+        self.texts = []
+        self.types = array('b')
+        self.urls = []
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextBatch":
+        """
+        Tokenize inline markdown straight into batch form.
+
+        Args:
+            text: String containing inline markdown
+
+        Returns:
+            TextBatch holding the token stream
+        """
+        batch = cls()
+        append = batch.append
+        for text_type, token_text, url in tokenize_inline(text):
+            append(token_text, text_type, url)
+        return batch
+
+    @classmethod
+    def from_nodes(cls, nodes) -> "TextBatch":
+        """
+        Build a batch from an existing list of TextNode objects.
+
+        Args:
+            nodes: List of TextNode objects
+
+        Returns:
+            TextBatch holding the same tokens
+        """
+        batch = cls()
+        for node in nodes:
+            batch.append(node.text, node.text_type, node.url)
+        return batch
+
+    def append(self, text: str, text_type: "TextType", url: Optional[str] = None) -> None:
+        self.texts.append(text)
+        self.types.append(text_type)
+        self.urls.append(url)
+
+    def to_nodes(self) -> list:
+        """
+        Materialize the batch as a list of TextNode objects.
+
+        Returns:
+            List of TextNode objects in token order
+        """
+        return [
+            TextNode(text, TextType(type_code), url)
+            for text, type_code, url in zip(self.texts, self.types, self.urls)
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        # Column-wise compare: three C-level sequence compares (the type
+        # array first, since it is the cheapest and most discriminating)
+        # instead of a Python __eq__ call per node
+        if not isinstance(other, TextBatch):
+            return NotImplemented
         return (
-            self.text == other.text and
-            self.text_type == other.text_type and
-            self.url == other.url
+            self.types == other.types
+            and self.texts == other.texts
+            and self.urls == other.urls
         )
-    
-    def __repr__(self):
-        return f"TextNode({self.text}, {self.text_type}, {self.url})"
+
+    def __iter__(self):
+        # Compatibility view: iterate as TextNode objects, built on demand
+        for text, type_code, url in zip(self.texts, self.types, self.urls):
+            yield TextNode(text, TextType(type_code), url)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+# Short plain-text segments (separators like " and ", " ") recur constantly
+# across documents; TextNode is frozen, so sharing one instance per segment
+# is safe and turns many equality checks into identity hits. Bounded so
+# pathological inputs cannot grow it without limit.
+_SHORT_TEXT_CACHE: dict = {}
+_SHORT_TEXT_MAX_LEN = 8
+_SHORT_TEXT_MAX_ENTRIES = 256
+
+# Hot-loop guard constant: the per-node "is this plain text" check resolves
+# one module global instead of an attribute chain per iteration
+_TEXT_TYPE = TextType.TEXT
+
+
+def _plain_text_node(segment):
+    node = _SHORT_TEXT_CACHE.get(segment)
+    if node is None:
+        if len(segment) <= _SHORT_TEXT_MAX_LEN and len(_SHORT_TEXT_CACHE) < _SHORT_TEXT_MAX_ENTRIES:
+            # Intern the fragment so equality against source literals (which
+            # CPython interns) short-circuits on pointer identity
+            segment = sys.intern(segment)
+            node = TextNode(segment, TextType.TEXT)
+            _SHORT_TEXT_CACHE[segment] = node
+        else:
+            node = TextNode(segment, TextType.TEXT)
+    return node
+
+
+def _make_delimiter_scanner(delimiter):
+    """
+    Build a scan function with one delimiter (and its length) baked into the
+    closure, so the tight loop carries no per-iteration len() or dispatch.
+    """
+    dlen = len(delimiter)
+
+    def scan(text, text_type, out, _TextNode=TextNode, _plain=_plain_text_node):
+        find = text.find
+        idx = find(delimiter)
+        if idx == -1:
+            # No delimiter found; caller keeps the original node
+            return False
+
+        # Single str.find scan: segments are emitted as they are found
+        # instead of materializing the full split list first, and the
+        # unclosed-delimiter check falls out of the toggle state
+        append = out.append
+        pos = 0
+        inside = False
+        while idx != -1:
+            segment = text[pos:idx]
+            if segment:
+                append(_TextNode(segment, text_type) if inside else _plain(segment))
+            pos = idx + dlen
+            inside = not inside
+            idx = find(delimiter, pos)
+
+        if inside:
+            raise ValueError(f"Invalid markdown syntax: unclosed delimiter '{delimiter}' in text '{text}'")
+
+        tail = text[pos:]
+        if tail:
+            append(_plain(tail))
+        return True
+
+    return scan
+
+
+# Scanners specialized at import for the delimiters the pipeline actually
+# uses; anything else gets a closure built on first sight. Interned keys
+# let the dict probe short-circuit on pointer identity when callers pass
+# the usual literals.
+_SPLIT_SCANNERS = {sys.intern(d): _make_delimiter_scanner(d) for d in ("**", "*", "_", "`")}
 
 
 def split_nodes_delimiter(old_nodes, delimiter, text_type):
     """
     Split text nodes based on a delimiter and create new nodes with the specified text type.
-    
+
     Args:
         old_nodes: List of TextNode objects to process
         delimiter: String delimiter to split on (e.g., "`", "**", "*")
         text_type: TextType enum value for the delimited text
-        
+
     Returns:
         List of TextNode objects with delimited text split into separate nodes
     """
+    scan = _SPLIT_SCANNERS.get(delimiter)
+    if scan is None:
+        scan = _make_delimiter_scanner(delimiter)
+
     new_nodes = []
-    
+    plain = _TEXT_TYPE
+
     for node in old_nodes:
-        if node.text_type != TextType.TEXT:
+        # Enum members are singletons, so identity stands in for equality
+        if node.text_type is not plain:
             # Only process TEXT type nodes
             new_nodes.append(node)
             continue
-            
+
         text = node.text
         if not text:
             # Empty text, skip
             continue
-            
-        if delimiter not in text:
-            # No delimiter found, keep original node
+
+        if not scan(text, text_type, new_nodes):
             new_nodes.append(node)
-            continue
-            
-        # Split the text by delimiter
-        parts = text.split(delimiter)
-        
-        # Check if we have an odd number of parts (delimiter pairs must be complete)
-        if len(parts) % 2 == 0:
-            raise ValueError(f"Invalid markdown syntax: unclosed delimiter '{delimiter}' in text '{text}'")
-        
-        # Process parts alternately: text, delimited, text, delimited, ...
-        for i, part in enumerate(parts):
-            if part:  # Only add non-empty parts
-                if i % 2 == 0:
-                    # Even index: regular text
-                    new_nodes.append(TextNode(part, TextType.TEXT))
-                else:
-                    # Odd index: delimited text
-                    new_nodes.append(TextNode(part, text_type))
-    
+
     return new_nodes
 
 
+def _iter_markdown_spans(text):
+    """
+    Scan markdown images and links with their source positions, lazily.
+
+    Tokens are located with str.find, which skips over plain spans at C
+    memchr speed instead of stepping the regex engine per character. Labels
+    may not contain brackets and URLs may not contain parentheses, matching
+    the original pattern semantics. Spans let the split functions slice the
+    surrounding text directly instead of re-searching for each token.
+
+    Args:
+        text: String containing markdown text
+
+    Yields:
+        Tuples of (start, end, is_image, text, url) in document order, where
+        start:end covers the full markdown token (including the leading bang
+        for images)
+    """
+    find = text.find
+    n = len(text)
+
+    i = find('[')
+    while i != -1:
+        close = find(']', i + 1)
+        if close == -1:
+            break
+
+        inner = find('[', i + 1)
+        if inner != -1 and inner < close:
+            # Nested '[' invalidates this label; restart at the inner bracket
+            i = inner
+            continue
+
+        if close + 1 >= n or text[close + 1] != '(':
+            i = find('[', close + 1)
+            continue
+
+        end = find(')', close + 2)
+        if end == -1:
+            break
+
+        if find('(', close + 2, end) != -1:
+            # '(' inside the URL: not a well-formed target
+            i = find('[', i + 1)
+            continue
+
+        label = text[i + 1:close]
+        url = text[close + 2:end]
+        if i > 0 and text[i - 1] == '!':
+            yield (i - 1, end + 1, True, label, url)
+        else:
+            yield (i, end + 1, False, label, url)
+
+        i = find('[', end + 1)
+
+
+def iter_markdown(text):
+    """
+    Scan markdown images and links out of text lazily, in a single pass.
+
+    Args:
+        text: String containing markdown text
+
+    Yields:
+        Tuples of (is_image, text, url) in document order
+    """
+    return (
+        (is_image, label, url)
+        for start, end, is_image, label, url in _iter_markdown_spans(text)
+    )
+
+
+def iter_markdown_images(text):
+    """
+    Yield (alt_text, url) tuples for each markdown image in text.
+
+    Args:
+        text: String containing markdown text
+
+    Yields:
+        Tuples of (alt_text, url) in document order
+    """
+    return ((label, url) for is_image, label, url in iter_markdown(text) if is_image)
+
+
+def iter_markdown_links(text):
+    """
+    Yield (anchor_text, url) tuples for each markdown link in text.
+
+    Args:
+        text: String containing markdown text
+
+    Yields:
+        Tuples of (anchor_text, url) in document order
+    """
+    return ((label, url) for is_image, label, url in iter_markdown(text) if not is_image)
+
+
+def extract_markdown(text):
+    """
+    Extract markdown images and links from text in a single pass.
+
+    Args:
+        text: String containing markdown text
+
+    Returns:
+        Tuple of (images, links), each a list of (text, url) tuples
+    """
+    images = []
+    links = []
+    for is_image, label, url in iter_markdown(text):
+        (images if is_image else links).append((label, url))
+    return images, links
+
+
 def extract_markdown_images(text):
     """
     Extract markdown images from text and return a list of tuples (alt_text, url).
-    
+
     Args:
         text: String containing markdown text
-        
+
     Returns:
         List of tuples where each tuple contains (alt_text, url)
     """
-    pattern = r"!\[([^\[\]]*?)\]\(([^\(\)]*?)\)"
-    matches = re.findall(pattern, text)
-    return matches
+    # Every well-formed token contains "](": one C-level substring check
+    # rejects token-free text without running the scanner at all
+    if "](" not in text:
+        return []
+    return list(iter_markdown_images(text))
 
 
 def extract_markdown_links(text):
     """
     Extract markdown links from text and return a list of tuples (anchor_text, url).
-    
+
     Args:
         text: String containing markdown text
-        
+
     Returns:
         List of tuples where each tuple contains (anchor_text, url)
     """
-    pattern = r"(?<!!)\[([^\[\]]*?)\]\(([^\(\)]*?)\)"
-    matches = re.findall(pattern, text)
-    return matches
+    if "](" not in text:
+        return []
+    return list(iter_markdown_links(text))
 
 
-def split_nodes_image(old_nodes):
+def _split_nodes_tokens(old_nodes, want_images):
     """
-    Split text nodes based on markdown image syntax and create new nodes.
-    
+    Shared single-sweep splitter behind split_nodes_image and split_nodes_link.
+
+    The span scanner reports where each token sits in the source text, so
+    surrounding text is sliced out directly instead of re-searching for the
+    reconstructed markdown of every token.
+
     Args:
         old_nodes: List of TextNode objects to process
-        
+        want_images: True to split on images, False to split on links
+
     Returns:
-        List of TextNode objects with image markdown split into separate nodes
+        List of TextNode objects with the requested token kind split out
     """
+    token_type = TextType.IMAGE if want_images else TextType.LINK
     new_nodes = []
-    
+    append = new_nodes.append
+    plain = _TEXT_TYPE
+
     for node in old_nodes:
-        if node.text_type != TextType.TEXT:
+        # Enum members are singletons, so identity stands in for equality
+        if node.text_type is not plain:
             # Only process TEXT type nodes
-            new_nodes.append(node)
+            append(node)
             continue
-            
+
         text = node.text
         if not text:
             # Empty text, skip
             continue
-            
-        # Extract all images from the text
-        images = extract_markdown_images(text)
-        
-        if not images:
-            # No images found, keep original node
-            new_nodes.append(node)
+
+        if "](" not in text:
+            # No well-formed token can exist; skip the scanner entirely
+            append(node)
             continue
-        
-        # Process each image in order
-        current_text = text
-        for image_alt, image_url in images:
-            # Split on the full image markdown
-            image_markdown = f"![{image_alt}]({image_url})"
-            sections = current_text.split(image_markdown, 1)
-            
-            if len(sections) != 2:
-                # Image not found in current text, skip
+
+        pos = 0
+        matched = False
+        for start, end, is_image, label, url in _iter_markdown_spans(text):
+            if is_image != want_images:
                 continue
-                
-            # Add text before the image (if not empty)
-            if sections[0]:
-                new_nodes.append(TextNode(sections[0], TextType.TEXT))
-                
-            # Add the image node
-            new_nodes.append(TextNode(image_alt, TextType.IMAGE, image_url))
-            
-            # Continue with text after the image
-            current_text = sections[1]
-        
-        # Add any remaining text after the last image
-        if current_text:
-            new_nodes.append(TextNode(current_text, TextType.TEXT))
-    
+            matched = True
+            # Add text before the token (if not empty)
+            if start > pos:
+                append(_plain_text_node(text[pos:start]))
+            append(TextNode(label, token_type, url))
+            pos = end
+
+        if not matched:
+            # No tokens of this kind, keep original node
+            append(node)
+            continue
+
+        # Add any remaining text after the last token
+        if pos < len(text):
+            append(_plain_text_node(text[pos:]))
+
     return new_nodes
 
 
+def split_nodes_image(old_nodes):
+    """
+    Split text nodes based on markdown image syntax and create new nodes.
+
+    Args:
+        old_nodes: List of TextNode objects to process
+
+    Returns:
+        List of TextNode objects with image markdown split into separate nodes
+    """
+    return _split_nodes_tokens(old_nodes, True)
+
+
 def split_nodes_link(old_nodes):
     """
     Split text nodes based on markdown link syntax and create new nodes.
-    
+
     Args:
         old_nodes: List of TextNode objects to process
-        
+
     Returns:
         List of TextNode objects with link markdown split into separate nodes
     """
-    new_nodes = []
-    
-    for node in old_nodes:
-        if node.text_type != TextType.TEXT:
-            # Only process TEXT type nodes
-            new_nodes.append(node)
-            continue
-            
-        text = node.text
-        if not text:
-            # Empty text, skip
-            continue
-            
-        # Extract all links from the text
-        links = extract_markdown_links(text)
-        
-        if not links:
-            # No links found, keep original node
-            new_nodes.append(node)
-            continue
-        
-        # Process each link in order
-        current_text = text
-        for link_text, link_url in links:
-            # Split on the full link markdown
-            link_markdown = f"[{link_text}]({link_url})"
-            sections = current_text.split(link_markdown, 1)
-            
-            if len(sections) != 2:
-                # Link not found in current text, skip
-                continue
-                
-            # Add text before the link (if not empty)
-            if sections[0]:
-                new_nodes.append(TextNode(sections[0], TextType.TEXT))
-                
-            # Add the link node
-            new_nodes.append(TextNode(link_text, TextType.LINK, link_url))
-            
-            # Continue with text after the link
-            current_text = sections[1]
-        
-        # Add any remaining text after the last link
-        if current_text:
-            new_nodes.append(TextNode(current_text, TextType.TEXT))
-    
-    return new_nodes
+    return _split_nodes_tokens(old_nodes, False)
+
+
+# Master inline pattern: one alternation covers every token kind so a single
+# scan replaces the six sequential split passes. Alternative order mirrors
+# the old pipeline's precedence (images, links, bold, italic, code).
+# Bracket tokens use negated character classes rather than '.*?', so the
+# engine cannot backtrack catastrophically on pathological inputs like
+# nested brackets; image/link extraction itself runs on the linear
+# str.find scanner in extract_markdown, not on this pattern. DOTALL lets
+# the delimiter spans cross newlines, matching the split pipeline (its
+# str.find scans never treated '\n' specially) — without it, multi-line
+# spans like a blockquote's "**bold\n> span**" fail to match and then
+# falsely trip the unclosed-delimiter check.
+_TOKEN_RE = re.compile(
+    r"!\[(?P<img_alt>[^\[\]]*?)\]\((?P<img_url>[^()]*?)\)"
+    r"|(?<!!)\[(?P<link_text>[^\[\]]*?)\]\((?P<link_url>[^()]*?)\)"
+    r"|\*\*(?P<bold>.*?)\*\*"
+    r"|\*(?P<italic>.+?)\*"
+    r"|_(?P<under>.*?)_"
+    r"|`(?P<code>.*?)`",
+    re.DOTALL,
+)
+
+# match.lastindex of each alternative -> token type (group numbers follow the
+# pattern above; images and links are handled separately since they carry URLs)
+_TOKEN_GROUP_TYPES = {5: TextType.BOLD, 6: TextType.ITALIC, 7: TextType.ITALIC, 8: TextType.CODE}
+
+# Checked in plain spans to reproduce the split pipeline's unclosed-delimiter
+# errors; '**' must be tested before '*'
+_DELIMITERS = ("**", "*", "_", "`")
+
+
+def _raise_if_unclosed(span):
+    """
+    Raise the pipeline's unclosed-delimiter error if a plain span still
+    contains a delimiter character after tokenization.
+
+    Args:
+        span: Plain-text span between recognized tokens
+    """
+    for delimiter in _DELIMITERS:
+        if delimiter in span:
+            raise ValueError(f"Invalid markdown syntax: unclosed delimiter '{delimiter}' in text '{span}'")
+
+
+def tokenize_inline(text):
+    """
+    Scan text once and yield (text_type, text, url) tokens in document order.
+
+    Plain spans come back as TEXT tokens with a None url. Empty delimited
+    tokens are dropped and unclosed delimiters raise ValueError, matching
+    the behavior of the sequential split pipeline this replaces.
+
+    Args:
+        text: String containing inline markdown
+
+    Yields:
+        Tuples of (TextType, token text, url or None)
+    """
+    pos = 0
+    for match in _TOKEN_RE.finditer(text):
+        start = match.start()
+        if start > pos:
+            span = text[pos:start]
+            _raise_if_unclosed(span)
+            yield (TextType.TEXT, span, None)
+        pos = match.end()
+
+        last = match.lastindex
+        if last == 2:
+            yield (TextType.IMAGE, match.group(1), match.group(2))
+        elif last == 4:
+            yield (TextType.LINK, match.group(3), match.group(4))
+        else:
+            token_text = match.group(last)
+            if token_text:
+                yield (_TOKEN_GROUP_TYPES[last], token_text, None)
+
+    if pos < len(text):
+        span = text[pos:]
+        _raise_if_unclosed(span)
+        yield (TextType.TEXT, span, None)
 
 
 def text_to_textnodes(text):
     """
     Convert markdown text into a list of TextNode objects.
-    
+
     This function processes markdown text and splits it into nodes based on:
     - Bold text (**text**)
     - Italic text (*text*)
     - Code blocks (`code`)
     - Images (![alt](url))
     - Links ([text](url))
-    
+
     Args:
         text: String containing markdown text
-        
+
     Returns:
         List of TextNode objects representing the parsed markdown
     """
-    # Start with a single TEXT node containing the entire text
-    nodes = [TextNode(text, TextType.TEXT)]
-    
-    # Apply all splitting functions in sequence
-    # Order matters: images and links first, then delimiters
-    nodes = split_nodes_image(nodes)
-    nodes = split_nodes_link(nodes)
-    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
-    nodes = split_nodes_delimiter(nodes, "*", TextType.ITALIC)
-    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
-    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
-    
-    return nodes
+    # Fresh list per call, backed by a memoized tuple: the same inline text
+    # recurs across pages (nav items, footers), and TextNode is frozen so
+    # sharing node instances between callers is safe
+    return list(_text_to_textnodes_cached(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_to_textnodes_cached(text):
+    if not text:
+        return ()
+    # Prose with no inline metacharacter (every token kind needs one of
+    # these; images additionally need '[') is one TEXT node — four C-level
+    # substring checks skip the tokenizer for the common plain case
+    if '*' not in text and '`' not in text and '_' not in text and '[' not in text:
+        return (TextNode(text, TextType.TEXT),)
+    # One tokenizer pass over the text instead of six sequential splits
+    return tuple(TextNode(token_text, text_type, url) for text_type, token_text, url in tokenize_inline(text))
+
+
+# Block separator: a blank line, including whitespace-only lines and any
+# run of further blank lines. The [ \t]* edges also swallow horizontal
+# whitespace hugging the gap, so split pieces come out already clean.
+_BLOCK_SEP = re.compile(r'[ \t]*\n\s*\n[ \t]*')
 
 
 def markdown_to_blocks(markdown):
     """
     Split markdown text into block-level elements.
-    
-    Blocks are separated by double newlines (\n\n) and represent distinct
-    structural elements like headings, paragraphs, lists, etc.
-    
+
+    Blocks are separated by blank lines and represent distinct structural
+    elements like headings, paragraphs, lists, etc.
+
     Args:
         markdown: String containing markdown text
-        
+
     Returns:
         List of block strings with leading/trailing whitespace stripped
     """
-    # Split on double newlines to get potential blocks
-    blocks = markdown.split('\n\n')
-    
-    # Strip whitespace from each block and filter out empty blocks
-    result = []
-    for block in blocks:
-        stripped_block = block.strip()
-        if stripped_block:  # Only add non-empty blocks
-            result.append(stripped_block)
-    
-    return result
+    # Strip the document once at the edges; with the separator consuming
+    # whitespace around each gap, the split pieces need no per-block strip
+    # and no empty-piece filter
+    stripped = markdown.strip()
+    if not stripped:
+        return []
+    if '\n' not in stripped:
+        # Single-line document: nothing to split
+        return [stripped]
+    return _BLOCK_SEP.split(stripped)
+
+
+# Block prefixes as module constants: classification is pure C-level
+# str.startswith against these — no regex engine involved
+_CODE_FENCE = "```"
+_QUOTE_PREFIX = ">"
+_ULIST_PREFIX = "- "
+
+
+def _check_heading(block):
+    # Heading: 1-6 # characters followed by a space. Counting via lstrip
+    # keeps the scan in C instead of a per-character Python loop
+    hash_count = len(block) - len(block.lstrip('#'))
+    if 1 <= hash_count <= 6 and hash_count < len(block) and block[hash_count] == ' ':
+        return BlockType.HEADING
+    return BlockType.PARAGRAPH
 
 
+def _check_code(block):
+    # Code block: starts and ends with ```
+    if block.startswith(_CODE_FENCE) and block.endswith(_CODE_FENCE):
+        return BlockType.CODE
+    return BlockType.PARAGRAPH
+
+
+# Whole-block shapes for the multi-line quote/list validators: every line
+# must carry the marker. One C-level fullmatch replaces a Python generator
+# over the split lines.
+_QUOTE_BLOCK_RE = re.compile(r'>[^\n]*(?:\n>[^\n]*)*')
+_ULIST_BLOCK_RE = re.compile(r'- [^\n]*(?:\n- [^\n]*)*')
+
+
+def _check_quote(block):
+    # Quote block: every line starts with >. Single-line blocks (the common
+    # case) skip the regex entirely — one prefix test
+    if '\n' not in block:
+        return BlockType.QUOTE if block.startswith(_QUOTE_PREFIX) else BlockType.PARAGRAPH
+    if _QUOTE_BLOCK_RE.fullmatch(block):
+        return BlockType.QUOTE
+    return BlockType.PARAGRAPH
+
+
+def _check_ulist(block):
+    # Unordered list: every line starts with - followed by space
+    if '\n' not in block:
+        return BlockType.UNORDERED_LIST if block.startswith(_ULIST_PREFIX) else BlockType.PARAGRAPH
+    if _ULIST_BLOCK_RE.fullmatch(block):
+        return BlockType.UNORDERED_LIST
+    return BlockType.PARAGRAPH
+
+
+# Ordered-list line marker: digits (no leading zero, matching the old
+# "1. "-prefix semantics) followed by ". "
+_OLIST_LINE = re.compile(r'([1-9]\d*)\. ')
+
+
+def _check_olist(block):
+    # Ordered list: lines numbered "1. ", "2. ", ... from 1. Matching the
+    # digits once and comparing integers avoids building an f"{n}. "
+    # prefix string per line; the first bad line short-circuits
+    if '\n' not in block:
+        return BlockType.ORDERED_LIST if block.startswith("1. ") else BlockType.PARAGRAPH
+    match = _OLIST_LINE.match
+    for number, line in enumerate(block.split('\n'), start=1):
+        m = match(line)
+        if m is None or int(m.group(1)) != number:
+            return BlockType.PARAGRAPH
+    return BlockType.ORDERED_LIST
+
+
+# Each block kind is uniquely determined by its first character, so one dict
+# lookup picks the single validator worth running instead of cascading
+# through every kind's prefix test
+_BLOCK_DISPATCH = {
+    '#': _check_heading,
+    '`': _check_code,
+    '>': _check_quote,
+    '-': _check_ulist,
+}
+for _digit in "0123456789":
+    _BLOCK_DISPATCH[_digit] = _check_olist
+del _digit
+
+
+@functools.lru_cache(maxsize=2048)
 def block_to_block_type(block):
     """
     Determine the type of a markdown block.
-    
+
+    Results are memoized: the same blocks (nav snippets, repeated list
+    templates, shared headings) recur across pages during site generation,
+    and the cached value is just a pointer to a BlockType singleton.
+
     Args:
         block: String representing a single markdown block (whitespace already stripped)
-        
+
     Returns:
         BlockType enum value representing the type of block
     """
-    lines = block.split('\n')
-    
-    # Check for heading (1-6 # characters, followed by space)
-    if block.startswith('#'):
-        # Count leading # characters
-        hash_count = 0
-        for char in block:
-            if char == '#':
-                hash_count += 1
-            else:
-                break
-        
-        # Must be 1-6 # characters followed by a space
-        if 1 <= hash_count <= 6 and hash_count < len(block) and block[hash_count] == ' ':
-            return BlockType.HEADING
-    
-    # Check for code block (starts and ends with ```)
-    if block.startswith('```') and block.endswith('```'):
-        return BlockType.CODE
-    
-    # Check for quote block (every line starts with >)
-    if all(line.startswith('>') for line in lines):
-        return BlockType.QUOTE
-    
-    # Check for unordered list (every line starts with - followed by space)
-    if all(line.startswith('- ') for line in lines):
-        return BlockType.UNORDERED_LIST
-    
-    # Check for ordered list (every line starts with number. followed by space, incrementing from 1)
-    if all(line and len(line) >= 3 for line in lines):  # Minimum "1. " is 3 characters
-        expected_num = 1
-        is_ordered_list = True
-        
-        for line in lines:
-            # Check if line starts with expected number followed by '. '
-            expected_start = f"{expected_num}. "
-            if not line.startswith(expected_start):
-                is_ordered_list = False
-                break
-            expected_num += 1
-        
-        if is_ordered_list:
-            return BlockType.ORDERED_LIST
-    
-    # Default to paragraph if no other conditions are met
+    if not block:
+        return BlockType.PARAGRAPH
+    check = _BLOCK_DISPATCH.get(block[0])
+    if check is not None:
+        return check(block)
+    # No kind starts with this character; paragraph without further tests
     return BlockType.PARAGRAPH
 
 
+# htmlnode imports TextType from this module, so importing back the other
+# way at the top would be circular. The symbols are bound once, on first
+# use, instead of re-running a function-local import (an IMPORT_NAME plus
+# sys.modules probe) on every call.
+_LeafNode = None
+_ParentNode = None
+_text_node_to_html_node = None
+
+
+def _bind_htmlnode():
+    global _LeafNode, _ParentNode, _text_node_to_html_node
+    from htmlnode import LeafNode, ParentNode, text_node_to_html_node
+    _LeafNode = LeafNode
+    _ParentNode = ParentNode
+    _text_node_to_html_node = text_node_to_html_node
+
+
 def text_to_children(text):
     """
     Convert text containing inline markdown to a list of HTMLNode children.
-    
+
     Args:
         text: String containing inline markdown
-        
+
     Returns:
         List of HTMLNode objects representing the parsed inline markdown
     """
-    from htmlnode import text_node_to_html_node
-    
-    text_nodes = text_to_textnodes(text)
-    children = []
-    for text_node in text_nodes:
-        html_node = text_node_to_html_node(text_node)
-        children.append(html_node)
-    return children
+    # Fresh list per caller; the memoized tuple behind it is shared
+    return list(_text_to_children_cached(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_to_children_cached(text):
+    # Repeated inline fragments (list-item boilerplate, shared headings)
+    # recur across blocks and pages; nodes are immutable after construction,
+    # so sharing the converted leaves between parents is safe. Reading the
+    # memoized token tuple directly skips the defensive list copy
+    # text_to_textnodes makes for external callers
+    convert = _text_node_to_html_node
+    if convert is None:
+        _bind_htmlnode()
+        convert = _text_node_to_html_node
+    return tuple(convert(text_node) for text_node in _text_to_textnodes_cached(text))
+
+
+# First h1 line: optional indentation, then literally "# " (a lone hash —
+# the mandatory space rules out deeper headings), capturing to end of line.
+# '.' stops at the newline, so no explicit terminator is needed.
+_H1_RE = re.compile(r'(?:^|\n)[ \t]*# (.*)')
 
 
 def extract_title(markdown):
     """
     Extract the h1 header from markdown text.
-    
+
     Args:
         markdown: String containing markdown text
-        
+
     Returns:
         String containing the h1 header text (without the # and whitespace)
-        
+
     Raises:
         ValueError: If no h1 header is found
     """
-    lines = markdown.split('\n')
-    
-    for line in lines:
-        # Only strip leading whitespace to preserve the space after #
-        lstripped_line = line.lstrip()
-        if lstripped_line.startswith('# '):
-            # Extract text after "# " and strip whitespace
-            return lstripped_line[2:].strip()
-    
-    raise ValueError("No h1 header found in markdown")
+    # One anchored search over the document instead of splitting every line
+    # into a list just to find the first match
+    match = _H1_RE.search(markdown)
+    if match is None:
+        raise ValueError("No h1 header found in markdown")
+    return match.group(1).strip()
 
 
+@functools.lru_cache(maxsize=256)
 def markdown_to_html_node(markdown):
     """
     Convert a full markdown document into a single parent HTMLNode.
-    
+
+    Results are memoized per document, so re-parsing the same source (the
+    common dev-loop rebuild case) is a dict hit. The returned tree is
+    frozen and shared between callers: treat it as immutable.
+
     Args:
         markdown: String containing markdown text
-        
+
     Returns:
         HTMLNode representing the markdown document as a div containing all blocks
     """
-    from htmlnode import LeafNode, ParentNode
-    
+    if _ParentNode is None:
+        _bind_htmlnode()
+    LeafNode = _LeafNode
+    ParentNode = _ParentNode
+
     blocks = markdown_to_blocks(markdown)
     block_nodes = []
     
     for block in blocks:
         block_type = block_to_block_type(block)
         
-        if block_type == BlockType.PARAGRAPH:
+        if block_type is BlockType.PARAGRAPH:
             # Replace newlines with spaces for paragraphs
             paragraph_text = block.replace('\n', ' ')
             children = text_to_children(paragraph_text)
             block_nodes.append(ParentNode("p", children))
             
-        elif block_type == BlockType.HEADING:
-            # Count leading # characters to determine heading level
-            hash_count = 0
-            for char in block:
-                if char == '#':
-                    hash_count += 1
-                else:
-                    break
-            
+        elif block_type is BlockType.HEADING:
+            # Count leading # characters (C-level lstrip) for heading level
+            hash_count = len(block) - len(block.lstrip('#'))
+
             # Extract text after "# " (hash_count + 1 characters)
             heading_text = block[hash_count + 1:]
             children = text_to_children(heading_text)
             block_nodes.append(ParentNode(f"h{hash_count}", children))
             
-        elif block_type == BlockType.CODE:
+        elif block_type is BlockType.CODE:
             # Remove surrounding ``` and create code block
             code_text = block[3:-3]  # Remove first and last 3 characters (```)
             # Strip leading newline only
@@ -442,7 +859,7 @@ def markdown_to_html_node(markdown):
             code_node = LeafNode("code", code_text)
             block_nodes.append(ParentNode("pre", [code_node]))
             
-        elif block_type == BlockType.QUOTE:
+        elif block_type is BlockType.QUOTE:
             # Remove > from each line and join with newlines
             lines = block.split('\n')
             quote_lines = []
@@ -456,7 +873,7 @@ def markdown_to_html_node(markdown):
             children = text_to_children(quote_text)
             block_nodes.append(ParentNode("blockquote", children))
             
-        elif block_type == BlockType.UNORDERED_LIST:
+        elif block_type is BlockType.UNORDERED_LIST:
             # Split into list items and create ul with li elements
             lines = block.split('\n')
             list_items = []
@@ -467,7 +884,7 @@ def markdown_to_html_node(markdown):
                 list_items.append(ParentNode("li", item_children))
             block_nodes.append(ParentNode("ul", list_items))
             
-        elif block_type == BlockType.ORDERED_LIST:
+        elif block_type is BlockType.ORDERED_LIST:
             # Split into list items and create ol with li elements
             lines = block.split('\n')
             list_items = []
@@ -479,5 +896,24 @@ def markdown_to_html_node(markdown):
                 list_items.append(ParentNode("li", item_children))
             block_nodes.append(ParentNode("ol", list_items))
     
-    # Return all blocks wrapped in a div
-    return ParentNode("div", block_nodes)
+    # Return all blocks wrapped in a div; freezing opts the cached tree in
+    # to render memoization, so repeated to_html() calls are also O(1)
+    return ParentNode("div", block_nodes).freeze()
+
+
+def markdown_to_html_str(markdown):
+    """
+    Render a markdown document straight to its HTML string.
+
+    Render-only entry point for callers that never inspect the node tree
+    (the site-generation CLI). The tree behind it is cached per document
+    and frozen, so both the parse and the serialization are paid once;
+    later renders of the same source are two dict hits.
+
+    Args:
+        markdown: String containing markdown text
+
+    Returns:
+        HTML string for the whole document
+    """
+    return markdown_to_html_node(markdown).to_html()